@@ -1,6 +1,12 @@
 import json
+import logging
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, asdict, field
+from typing import Optional
+
+log = logging.getLogger(__name__)
 
 
 def _user_config_dir() -> str:
@@ -25,7 +31,7 @@ class UISettings:
     auto_fetch_urls: bool = True
     auto_search_text: bool = True
     live_search: bool = True
-    search_debounce_seconds: int = 3
+    search_debounce_seconds: float = 0.5
     fast_paste_enabled: bool = True
     quality_refetch_seconds: int = 1
     background_metadata_enabled: bool = True
@@ -65,6 +71,37 @@ class AppSettings:
     app: AppUpdateSettings = field(default_factory=AppUpdateSettings)
 
 
+# Saves are numbered when the snapshot is taken (always on the UI thread), so a
+# background write that lands late never overwrites a newer snapshot
+_save_lock = threading.Lock()
+_save_seq = 0
+_written_seq = 0
+# One background writer for every async save; started on first use
+_save_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _next_seq() -> int:
+    global _save_seq
+    _save_seq += 1
+    return _save_seq
+
+
+def _write(data: dict, seq: int) -> bool:
+    global _written_seq
+    with _save_lock:
+        if seq < _written_seq:
+            return True
+        try:
+            os.makedirs(SETTINGS_DIR, exist_ok=True)
+            with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+        except (OSError, TypeError, ValueError) as e:
+            log.warning("Saving settings to %s failed: %s", SETTINGS_PATH, e)
+            return False
+        _written_seq = seq
+        return True
+
+
 class SettingsManager:
     def load(self) -> AppSettings:
         if not os.path.exists(SETTINGS_PATH) and os.path.exists(LEGACY_SETTINGS_PATH):
@@ -110,10 +147,15 @@ class SettingsManager:
         except Exception:
             return AppSettings()
 
-    def save(self, settings: AppSettings):
-        data = asdict(settings)
-        os.makedirs(SETTINGS_DIR, exist_ok=True)
-        with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-        with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+    def save(self, settings: AppSettings) -> bool:
+        return _write(asdict(settings), _next_seq())
+
+    def save_async(self, settings: AppSettings) -> Future:
+        # Snapshot now; only the file write leaves the UI thread. The Future
+        # resolves to False if the write failed (already logged).
+        global _save_executor
+        if _save_executor is None:
+            _save_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="settings-save"
+            )
+        return _save_executor.submit(_write, asdict(settings), _next_seq())
@@ -0,0 +1,189 @@
+import hashlib
+import os
+import re
+import tempfile
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, QSize, Qt
+from PyQt6.QtGui import QColor, QImage, QImageReader, QPainter, QPixmap
+from PyQt6.QtNetwork import QNetworkReply
+
+
+def _cache_dir() -> str:
+    # Machine-local (not roaming) cache next to the settings folder name
+    base = (
+        os.getenv("LOCALAPPDATA")
+        or os.getenv("XDG_CACHE_HOME")
+        or os.path.join(os.path.expanduser("~"), ".cache")
+    )
+    return os.path.join(base, "YoutubeConverter", "thumbs")
+
+
+CACHE_DIR = _cache_dir()
+MAX_DISK_FILES = 5000  # ~100 MB of list-sized thumbs; oldest pruned once per run
+_pruned = False
+ICON_SIZE = QSize(96, 54)  # list icon box used by every step
+MAX_THUMB_BYTES = 512 * 1024  # real stills are <100 KB; anything bigger is dropped
+THUMB_MIN_WIDTH = ICON_SIZE.width()  # anything wider than the icon is wasted decode
+# Unsigned YouTube stills: maxres/sd/hq are 480-1280 px wide, mqdefault is 320x180
+_YT_BIG_THUMB_RE = re.compile(r"/(?:maxres|sd|hq)default(\.(?:jpg|webp))$")
+
+# One pooled keep-alive session so thumbnails from the same CDN reuse sockets/TLS
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+
+# One resolver for every step, so cache keys (memory and disk) match across them
+def thumb_url(info: Dict) -> Optional[str]:
+    # Smallest listed thumbnail that still fills the icon, else the default one
+    thumbs = info.get("thumbnails") or []
+    best_w, url = 0, None
+    for t in thumbs:
+        w = t.get("width") or 0
+        if t.get("url") and w >= THUMB_MIN_WIDTH and (url is None or w < best_w):
+            best_w, url = w, t["url"]
+    if url is None:
+        url = info.get("thumbnail") or (thumbs[-1].get("url") if thumbs else None)
+    return _YT_BIG_THUMB_RE.sub(r"/mqdefault\1", url) if url else None
+
+
+def cache_path(url: str) -> str:
+    name = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(CACHE_DIR, name + ".img")
+
+
+def has(url: str) -> bool:
+    return os.path.exists(cache_path(url))
+
+
+# Disk layer: plain bytes, safe to call from worker threads
+def load_bytes(url: str) -> Optional[bytes]:
+    try:
+        with open(cache_path(url), "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def store_bytes(url: str, data: bytes):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _prune_once()
+        # Write to a temp file and rename so readers never see half a file
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, cache_path(url))
+        except Exception:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+    except Exception:
+        pass
+
+
+def discard(url: str):
+    # Drop an entry that turned out not to be a decodable image
+    try:
+        os.remove(cache_path(url))
+    except OSError:
+        pass
+
+
+def fetch_bytes(url: str, timeout: int = 6) -> Optional[bytes]:
+    # Disk first, then network (stored for next time)
+    data = load_bytes(url)
+    if data is not None:
+        return data
+    try:
+        # Stream with a hard cap so a bogus/huge response can't balloon memory
+        with _session.get(url, timeout=timeout, stream=True) as r:
+            if not r.ok:
+                return None
+            if int(r.headers.get("Content-Length") or 0) > MAX_THUMB_BYTES:
+                return None
+            data = r.raw.read(MAX_THUMB_BYTES + 1, decode_content=True)
+    except Exception:
+        return None
+    if not data or len(data) > MAX_THUMB_BYTES:
+        return None
+    store_bytes(url, data)
+    return data
+
+
+# Same cap for QNetworkAccessManager downloads: abort once past the limit
+def cap_reply(reply: QNetworkReply):
+    def _check(received: int, total: int):
+        if received > MAX_THUMB_BYTES or total > MAX_THUMB_BYTES:
+            reply.abort()
+
+    reply.downloadProgress.connect(_check)
+
+
+# Body of a finished capped reply, or None if it failed or was too big (a fast
+# response can finish before the abort lands)
+def reply_bytes(reply: QNetworkReply) -> Optional[bytes]:
+    if reply.error() != QNetworkReply.NetworkError.NoError:
+        return None
+    if reply.bytesAvailable() > MAX_THUMB_BYTES:
+        return None
+    return bytes(reply.readAll()) or None
+
+
+# Decode straight to the icon box (JPEG scales inside the decoder) so lists
+# never hold or resample full-size stills; dpr keeps HiDPI sharp. Null on
+# failure. Safe on worker threads.
+def decode_icon(data: bytes, dpr: float = 1.0) -> QImage:
+    buf = QBuffer()
+    buf.setData(QByteArray(data))
+    buf.open(QIODevice.OpenModeFlag.ReadOnly)
+    reader = QImageReader(buf)
+    reader.setAutoTransform(True)
+    box = ICON_SIZE * max(1.0, dpr)
+    size = reader.size()
+    if size.isValid() and (size.width() > box.width() or size.height() > box.height()):
+        reader.setScaledSize(size.scaled(box, Qt.AspectRatioMode.KeepAspectRatio))
+    return reader.read()
+
+
+def placeholder_pixmap(w: int, h: int, accent_hex: str) -> QPixmap:
+    # Dark thumbnail-sized tile so rows have their final height before thumbs arrive
+    pix = QPixmap(w, h)
+    pix.fill(QColor("#111"))
+    p = QPainter(pix)
+    border = QColor(accent_hex)
+    border.setAlpha(90)
+    p.setPen(border)
+    p.drawRect(0, 0, w - 1, h - 1)
+    p.end()
+    return pix
+
+
+def _prune_once():
+    global _pruned
+    if _pruned:
+        return
+    _pruned = True
+    try:
+        entries = [e for e in os.scandir(CACHE_DIR) if e.is_file()]
+        if len(entries) <= MAX_DISK_FILES:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for e in entries[: len(entries) - MAX_DISK_FILES]:
+            try:
+                os.remove(e.path)
+            except OSError:
+                pass
+    except OSError:
+        pass
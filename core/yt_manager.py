@@ -1,12 +1,12 @@
 import os
-from typing import Dict, List, Optional, Callable
-from threading import Event
+from typing import List, Optional, Callable
+from threading import Event, Timer
 from PyQt6.QtCore import QThread, pyqtSignal
 import yt_dlp
 import subprocess
-import requests
 import json
 from core.update import YTDLP_EXE
+from core import thumb_cache
 
 HTTP_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
@@ -17,6 +17,25 @@ EXTRACTOR_ARGS = {
     "youtubetab": {"skip": ["webpage"]},
 }
 
+# yt-dlp binary flags for metadata-only runs (output flag -J/-j added per caller)
+BINARY_INFO_ARGS = [
+    "--ignore-config",
+    "--no-warnings",
+    "--no-progress",
+    "--skip-download",
+    "--no-write-comments",
+    "--no-write-playlist-metafiles",
+    "--no-cache-dir",
+    "--extractor-retries",
+    "1",
+    "--extractor-args",
+    "youtube:player_client=tv",
+    "--extractor-args",
+    "youtube:skip=dash,hls",
+    "--extractor-args",
+    "youtubetab:skip=webpage",
+]
+
 
 def _win_no_window_kwargs():
     if os.name != "nt":
@@ -118,6 +137,18 @@ class InfoFetcher(QThread):
         super().__init__()
         self.url = url
         self.timeout_sec = timeout_sec
+        self._proc: Optional[subprocess.Popen] = None
+
+    def cancel(self):
+        # Result no longer wanted: kill the yt-dlp process if one is running,
+        # and skip the fallback/emit otherwise. Ends with finished_fail.
+        self.requestInterruption()
+        proc = self._proc
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.kill()
+            except Exception:
+                pass
 
     def _is_search(self) -> bool:
         return isinstance(self.url, str) and self.url.startswith("ytsearch")
@@ -132,25 +163,7 @@ class InfoFetcher(QThread):
     def _extract_with_binary(self) -> dict:
         is_search = self._is_search()
         is_playlist = self._is_playlist()
-        args = [
-            YTDLP_EXE,
-            "-J",
-            "--ignore-config",
-            "--no-warnings",
-            "--no-progress",
-            "--skip-download",
-            "--no-write-comments",
-            "--no-write-playlist-metafiles",
-            "--no-cache-dir",
-            "--extractor-retries",
-            "1",
-            "--extractor-args",
-            "youtube:player_client=tv",
-            "--extractor-args",
-            "youtube:skip=dash,hls",
-            "--extractor-args",
-            "youtubetab:skip=webpage",
-        ]
+        args = [YTDLP_EXE, "-J", *BINARY_INFO_ARGS]
         if is_search or is_playlist:
             args.append("--flat-playlist")
         args.append(self.url)
@@ -158,19 +171,31 @@ class InfoFetcher(QThread):
         env = os.environ.copy()
         env["YTDLP_NO_PLUGINS"] = "1"
         kwargs = _win_no_window_kwargs()
-        proc = subprocess.run(
+        # Popen instead of run() so cancel() can kill it mid-fetch
+        proc = subprocess.Popen(
             args,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=self.timeout_sec,
             env=env,
             **kwargs,
         )
+        self._proc = proc
+        if self.isInterruptionRequested():
+            proc.kill()
+        try:
+            stdout, stderr = proc.communicate(timeout=self.timeout_sec)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+        finally:
+            self._proc = None
         if proc.returncode != 0:
-            raise RuntimeError(proc.stderr.strip() or "yt-dlp binary failed")
-        if not proc.stdout:
+            raise RuntimeError(stderr.strip() or "yt-dlp binary failed")
+        if not stdout:
             raise RuntimeError("Empty response from yt-dlp")
-        return json.loads(proc.stdout)
+        return json.loads(stdout)
 
     def _extract_with_python_api(self, use_tv_client: bool = True) -> dict:
         is_search = self._is_search()
@@ -197,10 +222,16 @@ class InfoFetcher(QThread):
                 info = self._extract_with_binary()
             else:
                 info = self._extract_with_python_api(use_tv_client=True)
+            if self.isInterruptionRequested():
+                self.finished_fail.emit("Cancelled")
+                return
             self.finished_ok.emit(info)
         except subprocess.TimeoutExpired:
             self.finished_fail.emit("Timed out while fetching info")
         except Exception:
+            if self.isInterruptionRequested():
+                self.finished_fail.emit("Cancelled")
+                return
             try:
                 info = self._extract_with_python_api(use_tv_client=False)
                 self.finished_ok.emit(info)
@@ -208,6 +239,139 @@ class InfoFetcher(QThread):
                 self.finished_fail.emit(str(e2))
 
 
+class BatchInfoFetcher(QThread):
+    # Full metadata for many single-video URLs in one extractor session:
+    # one yt-dlp process (or one YoutubeDL) instead of one per URL
+    itemOk = pyqtSignal(str, dict)  # url, info
+    itemFail = pyqtSignal(str, str)  # url, error
+
+    def __init__(self, urls: List[str], timeout_sec: int = 60):
+        super().__init__()
+        self.urls = list(urls)
+        self.timeout_sec = timeout_sec
+        # Each URL is reported exactly once; callers count the callbacks
+        self._reported = set()
+        self._proc: Optional[subprocess.Popen] = None
+
+    def cancel(self):
+        # Same as InfoFetcher.cancel: kill the yt-dlp process, skip the fallback
+        self.requestInterruption()
+        proc = self._proc
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.kill()
+            except Exception:
+                pass
+
+    def _ok(self, url: str, info: dict):
+        self._reported.add(url)
+        self.itemOk.emit(url, info)
+
+    def _fail(self, url: str, err: str):
+        self._reported.add(url)
+        self.itemFail.emit(url, err)
+
+    def _left(self) -> List[str]:
+        return [u for u in self.urls if u not in self._reported]
+
+    def _extract_with_binary(self) -> List[str]:
+        # -j prints one JSON line per finished URL; returns the URLs left over
+        args = [YTDLP_EXE, "-j", "--ignore-errors", *BINARY_INFO_ARGS, *self.urls]
+        env = os.environ.copy()
+        env["YTDLP_NO_PLUGINS"] = "1"
+        # Popen + line reads: each URL is reported as its line lands, and
+        # cancel() (or the overall deadline) can kill the process mid-batch
+        proc = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            env=env,
+            **_win_no_window_kwargs(),
+        )
+        self._proc = proc
+        if self.isInterruptionRequested():
+            proc.kill()
+        deadline = Timer(self.timeout_sec * max(1, len(self.urls)), proc.kill)
+        deadline.start()
+        wanted = set(self.urls)
+        try:
+            for line in proc.stdout:
+                try:
+                    info = json.loads(line)
+                except ValueError:
+                    continue
+                url = info.get("original_url")
+                if url in wanted and url not in self._reported:
+                    self._ok(url, info)
+        finally:
+            deadline.cancel()
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+            self._proc = None
+        return self._left()
+
+    def _ydl_opts(self, use_tv_client: bool) -> dict:
+        opts = {
+            "quiet": True,
+            "skip_download": True,
+            "noprogress": True,
+            "noplaylist": False,
+            "extract_flat": False,
+            "socket_timeout": 15,
+            "extractor_retries": 2,
+            "cachedir": False,
+            "http_headers": HTTP_HEADERS,
+        }
+        if use_tv_client:
+            opts["extractor_args"] = EXTRACTOR_ARGS
+        return opts
+
+    def _extract_with_python_api(self, urls: List[str]):
+        fallback = None
+        try:
+            with yt_dlp.YoutubeDL(self._ydl_opts(True)) as ydl:
+                for url in urls:
+                    if self.isInterruptionRequested():
+                        return
+                    try:
+                        info = ydl.extract_info(url, download=False)
+                    except Exception:
+                        # Same retry as InfoFetcher, built once for the batch
+                        try:
+                            if fallback is None:
+                                fallback = yt_dlp.YoutubeDL(self._ydl_opts(False))
+                            info = fallback.extract_info(url, download=False)
+                        except Exception as e:
+                            self._fail(url, str(e))
+                            continue
+                    if isinstance(info, dict):
+                        self._ok(url, info)
+                    else:
+                        self._fail(url, "No info returned")
+        finally:
+            if fallback is not None:
+                fallback.close()
+
+    def run(self):
+        try:
+            if os.path.exists(YTDLP_EXE):
+                self._extract_with_binary()
+        except Exception:
+            pass
+        if self.isInterruptionRequested():
+            return
+        urls = self._left()
+        try:
+            if urls:
+                self._extract_with_python_api(urls)
+        except Exception as e:
+            # Only the URLs not already reported before the failure
+            for url in self._left():
+                self._fail(url, str(e))
+
+
 class Downloader(QThread):
     itemProgress = pyqtSignal(int, float, float, object)
     itemStatus = pyqtSignal(int, str)
@@ -233,7 +397,6 @@ class Downloader(QThread):
         self._pause_evt = Event()
         self._pause_evt.set()
         self._stop = False
-        self._meta_threads: Dict[int, InfoFetcher] = {}
 
     def pause(self):
         self._pause_evt.clear()
@@ -273,18 +436,11 @@ class Downloader(QThread):
 
     def run(self):
         for idx, it in enumerate(self.items):
-            thumb_url = (
-                (it.get("thumbnail") or it.get("thumbnails", [{}])[-1].get("url"))
-                if it
-                else None
-            )
+            thumb_url = thumb_cache.thumb_url(it) if it else None
             if thumb_url:
-                try:
-                    r = requests.get(thumb_url, timeout=10)
-                    if r.ok:
-                        self.itemThumb.emit(idx, r.content)
-                except Exception:
-                    pass
+                data = thumb_cache.fetch_bytes(thumb_url, timeout=10)
+                if data:
+                    self.itemThumb.emit(idx, data)
 
         for idx, it in enumerate(self.items):
             if self._stop:
@@ -315,39 +471,6 @@ class Downloader(QThread):
                 self.itemStatus.emit(idx, f"Error: {e}")
         self.finished_all.emit()
 
-    def _start_meta_fetch(self, idx: int, url: str):
-        if idx in self._meta_threads:
-            return
-        self.itemStatus.emit(idx, "Fetching metadata...")
-        f = InfoFetcher(url)
-
-        def _ok(meta: dict, i=idx):
-            try:
-                self.items[i] = {**self.items[i], **(meta or {})}
-                thumb_url = self.items[i].get("thumbnail") or (
-                    self.items[i].get("thumbnails") or [{}]
-                )[-1].get("url")
-                if thumb_url:
-                    try:
-                        r = requests.get(thumb_url, timeout=10)
-                        if r.ok:
-                            self.itemThumb.emit(i, r.content)
-                    except Exception:
-                        pass
-                title = self.items[i].get("title") or "Untitled"
-                self.itemStatus.emit(i, f"Metadata ready: {title}")
-            finally:
-                self._meta_threads.pop(i, None)
-
-        def _fail(err: str, i=idx):
-            self.itemStatus.emit(i, f"Metadata fetch failed, will try best available")
-            self._meta_threads.pop(i, None)
-
-        f.finished_ok.connect(_ok)
-        f.finished_fail.connect(_fail)
-        self._meta_threads[idx] = f
-        f.start()
-
     def _needs_metadata(self, it: dict) -> bool:
         if not it:
             return True
@@ -373,14 +496,3 @@ class Downloader(QThread):
         }
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             return ydl.extract_info(url, download=False)
-
-    def _needs_metadata(self, it: dict) -> bool:
-        if not it:
-            return True
-        if not it.get("url") and not it.get("webpage_url"):
-            return False
-        has_core = (
-            bool(it.get("id")) or bool(it.get("duration")) or bool(it.get("extractor"))
-        )
-        has_thumb = bool(it.get("thumbnail")) or bool(it.get("thumbnails"))
-        return not (has_core and has_thumb)
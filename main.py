@@ -506,6 +506,7 @@ class MainWindow(QMainWindow):
         if c.isValid():
             self.settings.ui.accent_color_hex = c.name()
             self.setStyleSheet(self.style_mgr.with_accent(c.name()))
+            self.step1.apply_accent(c.name())
             self._settings_changed()
             self._toast(f"Accent changed to {c.name()}")  # CHANGED
 
@@ -7,7 +7,7 @@ from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
     QPushButton,
-    QSpinBox,
+    QDoubleSpinBox,
     QLabel,
     QMessageBox,
 )
@@ -56,10 +56,12 @@ class SettingsPage(QWidget):
             bool(getattr(settings.ui, "auto_clear_on_success", False))
         )
         frm_search.addRow("Auto clear input on success", self.chk_auto_clear_success)
-        self.spn_search_debounce = QSpinBox()
+        self.spn_search_debounce = QDoubleSpinBox()
         self.spn_search_debounce.setRange(0, 10)
+        self.spn_search_debounce.setDecimals(1)
+        self.spn_search_debounce.setSingleStep(0.1)
         self.spn_search_debounce.setValue(
-            int(getattr(settings.ui, "search_debounce_seconds", 3))
+            float(getattr(settings.ui, "search_debounce_seconds", 0.5))
         )
         frm_search.addRow("Search debounce (s)", self.spn_search_debounce)
         lay.addWidget(grp_search)
@@ -155,7 +157,7 @@ class SettingsPage(QWidget):
     def apply_to(self, settings: AppSettings):
         # UI
         settings.ui.auto_search_text = self.chk_auto_search_text.isChecked()
-        settings.ui.search_debounce_seconds = int(self.spn_search_debounce.value())
+        settings.ui.search_debounce_seconds = float(self.spn_search_debounce.value())
         settings.ui.auto_clear_on_success = self.chk_auto_clear_success.isChecked()
 
         # yt-dlp
@@ -1,7 +1,20 @@
 import re
-from typing import Dict, List, Tuple
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer, QThread
+import functools
+from typing import Dict, List, Optional, Set, Tuple
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QSize,
+    QTimer,
+    QThread,
+    QEvent,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QUrl,
+)
 from PyQt6.QtWidgets import (
+    QApplication,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
@@ -16,16 +29,107 @@ from PyQt6.QtWidgets import (
     QProgressBar,
     QFrame,  # NEW
 )
-from PyQt6.QtGui import QIcon, QPixmap, QColor, QImage
+from PyQt6.QtGui import (
+    QIcon,
+    QPixmap,
+    QPixmapCache,
+    QColor,
+    QImage,
+    QKeySequence,
+)
 from urllib.parse import urlparse, parse_qs, urlunparse, urlencode
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 from collections import deque
+import threading
 
+from core import thumb_cache
 from core.settings import AppSettings
-from core.yt_manager import InfoFetcher
+from core.yt_manager import BatchInfoFetcher, InfoFetcher
 
 YOUTUBE_URL_RE = re.compile(r"https?://[^\s]+")
-VIDEO_HOSTS = ("www.youtube.com", "m.youtube.com", "youtube.com", "youtu.be")
+# Hosts _classify_url understands (VIDEO_HOSTS); anything else skips urlparse
+YT_URL_RE = re.compile(
+    r"https?://(?:(?:www|m)\.)?(?:youtube\.com|youtu\.be)(?:[/?#]\S*)?"
+)
+URL_PREFIXES = ("http://", "https://")  # cheap pre-check before the regex
+VIDEO_HOSTS = frozenset(("www.youtube.com", "m.youtube.com", "youtube.com", "youtu.be"))
+# urlunparse parts for a normalized watch URL, minus (query, fragment)
+_WATCH_PARTS = ("https", "www.youtube.com", "/watch", "")
 ICON_PIXMAP_ROLE = int(Qt.ItemDataRole.UserRole) + 1  # store original pixmap
+# Ready-made icons so restyling an item never rebuilds a QIcon
+ICON_GRAY_ICON_ROLE = int(Qt.ItemDataRole.UserRole) + 2
+ICON_COLOR_ICON_ROLE = int(Qt.ItemDataRole.UserRole) + 3
+STYLE_STATE_ROLE = int(Qt.ItemDataRole.UserRole) + 4  # last applied selected state
+_KEY = "_key"  # resolved video URL, stored on dicts as they enter self.selected
+CONFIRM_MAX_PARALLEL = 8  # metadata batches in flight at once on confirm
+# Info fetches (searches + pasted URLs) running at once; extractions are independent
+FETCH_MAX_PARALLEL = max(2, QThread.idealThreadCount() - 2)
+THUMB_CACHE_KB = 64 * 1024  # decoded thumbnails kept in QPixmapCache
+_GRAY_SUFFIX = "#gray"  # cache key suffix for the grayscale variant
+
+# Enum lookups cached once; these are hit on every key press / list iteration
+_USER_ROLE = Qt.ItemDataRole.UserRole
+_KEYPRESS = QEvent.Type.KeyPress
+_PASTE_KEY = QKeySequence.StandardKey.Paste
+
+
+def _gray_image(img: QImage) -> QImage:
+    # Already gray (e.g. B/W thumbnails): nothing to convert
+    if img.format() == QImage.Format.Format_Grayscale8 or img.isGrayscale():
+        return img
+    return img.convertToFormat(QImage.Format.Format_Grayscale8)
+
+
+class _ThumbSignals(QObject):
+    # image, gray image (null unless requested), url; QImage because QPixmap
+    # may only be created on the GUI thread
+    done = pyqtSignal(QImage, QImage, str)
+    failed = pyqtSignal(str)  # url
+
+
+# Decodes a downloaded (or disk-cached, data=None) thumbnail on the shared pool
+class _ThumbTask(QRunnable):
+    def __init__(
+        self,
+        url: str,
+        data: Optional[bytes],
+        stop: threading.Event,
+        gray: bool,
+        dpr: float = 1.0,
+    ):
+        super().__init__()
+        self.url = url
+        self.data = data
+        self.stop = stop  # set by reset(); checked between stages
+        self.gray = gray  # also build the unselected (gray) variant here
+        self.dpr = dpr  # device pixel ratio for the pre-scaled icon
+        # QRunnable can't carry signals; this lives on the GUI thread, so
+        # emits from the pool are queued back to it
+        self.signals = _ThumbSignals()
+
+    def run(self):
+        try:
+            if self.stop.is_set():
+                return
+            data = self.data
+            from_disk = data is None
+            if from_disk:
+                data = thumb_cache.load_bytes(self.url)
+            img = thumb_cache.decode_icon(data, self.dpr) if data else QImage()
+            if img.isNull():
+                if from_disk:
+                    thumb_cache.discard(self.url)
+                self.signals.failed.emit(self.url)
+                return
+            if not from_disk:
+                thumb_cache.store_bytes(self.url, data)
+            if self.stop.is_set():
+                return
+            gray = _gray_image(img) if self.gray else QImage()
+            if not self.stop.is_set():
+                self.signals.done.emit(img, gray, self.url)
+        except Exception:
+            self.signals.failed.emit(self.url)
 
 
 class Step1LinkWidget(QWidget):
@@ -35,43 +139,53 @@ class Step1LinkWidget(QWidget):
     # New: emit full list of selected info dicts
     selectionConfirmed = pyqtSignal(list)
 
-    # Small worker to fetch a single thumbnail without blocking UI
-    class _ThumbWorker(QThread):
-        done = pyqtSignal(int, QPixmap, str)  # row, pixmap, url
-
-        def __init__(self, row: int, url: str, parent=None):
-            super().__init__(parent)
-            self.row = row
-            self.url = url
-
-        def run(self):
-            try:
-                from urllib.request import urlopen
-
-                data = urlopen(self.url, timeout=5).read()
-                px = QPixmap()
-                if px.loadFromData(data):
-                    self.done.emit(self.row, px, self.url)
-            except Exception:
-                pass
+    # Thumbnail decodes share a bounded pool instead of a thread per item
+    _THUMB_POOL = QThreadPool()
+    _THUMB_POOL.setMaxThreadCount(max(1, min(8, QThread.idealThreadCount())))
 
     def __init__(self, settings: AppSettings):
         super().__init__()
         self.settings = settings
-        self.fetcher = None
         self.selected: List[Dict] = []
+        # url -> index into self.selected; kept in sync on every mutation
+        self._selected_by_url: Dict[str, int] = {}
+        # Python-side mirror of playlist_list, keyed by video URL, so bulk ops
+        # don't have to go through item(i).data() for every row
+        self._playlist_items_by_url: Dict[str, QListWidgetItem] = {}
+        self._playlist_entries_by_url: Dict[str, Dict] = {}
+        # Same for selected_list; its rows follow self.selected order 1:1
+        self._selected_items: Dict[str, QListWidgetItem] = {}
         self._bg_fetchers = {}
-        # Request management
-        self._active_req_id = 0
-        # self._pending_url: str | None = None  # REMOVED: replaced by queue
-        self._thumb_threads: List[Step1LinkWidget._ThumbWorker] = []  # NEW
-        # NEW: request queue and newest pending search coalescer
+        # Request management: up to FETCH_MAX_PARALLEL fetches in flight.
+        # Searches are tagged with a generation; a newer search obsoletes older ones.
+        self._gen = 0
+        self._desired_url: str | None = None  # newest search not yet started
+        self._inflight: Set[InfoFetcher] = set()
+        # Explicit URLs are each a user action (multi-add), so keep them all
         self._queue = deque()  # type: deque[str]
-        self._queued_search: str | None = None
+        # Shared by queued thumb tasks; reset() sets it and starts a new one
+        self._thumb_stop = threading.Event()
+        # thumb url -> [(row, on_done, gray)] waiting on the one download in flight
+        self._thumb_waiters: Dict[str, list] = {}
+        # Thumbs download through one manager: keep-alive/HTTP2 connections are
+        # reused and the I/O runs on the event loop, no thread per request
+        self._nam = QNetworkAccessManager(self)
+        self._thumb_replies: Dict[str, QNetworkReply] = {}
+        # Decoded thumbs are cached process-wide by URL; reopening a playlist
+        # or rebuilding the Selected tab then costs no network/decode
+        if QPixmapCache.cacheLimit() < THUMB_CACHE_KB:
+            QPixmapCache.setCacheLimit(THUMB_CACHE_KB)
+        # Playlist row colors, parsed once instead of per styled item
+        self._col_accent = QColor(self.settings.ui.accent_color_hex)
+        self._col_dim = QColor("#8a8b90")
+        # One shared icon for rows whose thumbnail hasn't loaded yet
+        self._placeholder_icon = QIcon(
+            thumb_cache.placeholder_pixmap(96, 54, self.settings.ui.accent_color_hex)
+        )
 
         # NEW: confirm-fetch state
         self._confirm_inflight = False
-        self._confirm_fetchers: dict[int, InfoFetcher] = {}
+        self._confirm_fetchers: dict[int, BatchInfoFetcher] = {}
         self._confirm_total = 0
         self._confirm_done = 0
 
@@ -168,6 +282,12 @@ class Step1LinkWidget(QWidget):
         self.playlist_list.setVerticalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
         pl_lay.addWidget(self.playlist_list, 1)
 
+        # Every row is one text line + a 96x54 icon: measure once, lay out in batches
+        for lw in (self.results, self.selected_list, self.playlist_list):
+            lw.setUniformItemSizes(True)
+            lw.setLayoutMode(QListWidget.LayoutMode.Batched)
+            lw.setBatchSize(50)
+
         # Bottom row with Next button
         bottom = QHBoxLayout()
         bottom.addStretch(1)
@@ -191,9 +311,20 @@ class Step1LinkWidget(QWidget):
         self.search_timer.setSingleShot(True)
         self.search_timer.timeout.connect(self._do_debounced_search)
 
+        # Coalesce Selected-tab rebuilds from rapid toggles into one per frame
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(16)
+        self._refresh_timer.timeout.connect(self._refresh_selected_list_impl)
+
         # Ensure the Select-all toggle visibility matches multi-select state
         self.chk_pl_select_all.setVisible(self.chk_multi.isChecked())
 
+    @staticmethod
+    def _key(info: Dict):
+        # _KEY is stamped on entries once resolved; then it's a single dict read
+        return info.get(_KEY) or info.get("webpage_url") or info.get("url")
+
     # ----- UI Helpers -----
 
     def _set_busy(self, on: bool):
@@ -207,60 +338,64 @@ class Step1LinkWidget(QWidget):
             self.loading_bar.setValue(0)
 
     def _refresh_selected_list(self):
-        self.selected_list.clear()
-        for it in self.selected:
-            title = it.get("title") or "Untitled"
-            lw = QListWidgetItem(title)
-            # Async thumb fetch to avoid blocking UI
-            url = (it or {}).get("webpage_url") or (it or {}).get("url")
-            thumb = (
-                (it.get("thumbnail") or (it.get("thumbnails") or [{}])[-1].get("url"))
-                if isinstance(it, dict)
-                else None
-            )
+        self._refresh_timer.start()
+
+    # Full rebuild; only bulk changes (select-all, clear) go through here.
+    # Single adds/removes touch just their own row (see _add/_remove_selected).
+    def _refresh_selected_list_impl(self):
+        # clear() is a single model reset; suppress repaints while rows are re-added
+        self.selected_list.setUpdatesEnabled(False)
+        try:
+            self.selected_list.clear()
+            self._selected_items.clear()
+            for it in self.selected:
+                self.selected_list.addItem(self._new_selected_item(it))
+        finally:
+            self.selected_list.setUpdatesEnabled(True)
+        self.tabs.setTabVisible(self.idx_selected, self.selected_list.count() > 0)
+
+    def _new_selected_item(self, it: Dict) -> QListWidgetItem:
+        url = it[_KEY]
+        lw = QListWidgetItem(it.get("title") or "Untitled")
+        lw.setData(_USER_ROLE, it)
+        self._selected_items[url] = lw
+        # Cached thumbs go straight onto the row; only misses hit the pool
+        thumb = thumb_cache.thumb_url(it)
+        pix = QPixmapCache.find(thumb) if thumb else None
+        if pix is not None:
+            lw.setIcon(QIcon(pix))
+            lw.setData(ICON_PIXMAP_ROLE, pix)
+        else:
+            lw.setIcon(self._placeholder_icon)
             if thumb:
-                worker = Step1LinkWidget._ThumbWorker(-1, thumb, self)
-                worker.done.connect(
-                    lambda _row, px, _thumb_url, vurl=url: self._set_selected_icon_for_url(
+                self._start_thumb(
+                    -1,
+                    thumb,
+                    lambda _row, px, _gray, _thumb_url, vurl=url: self._set_selected_icon_for_url(
                         vurl, px
-                    )
-                )
-                worker.finished.connect(
-                    lambda w=worker: (
-                        self._thumb_threads.remove(w)
-                        if w in self._thumb_threads
-                        else None
-                    )
+                    ),
                 )
-                self._thumb_threads.append(worker)
-                worker.start()
-            lw.setData(Qt.ItemDataRole.UserRole, it)
-            self.selected_list.addItem(lw)
-        self.tabs.setTabVisible(self.idx_selected, self.selected_list.count() > 0)
+        return lw
 
     # ----- Event Handlers -----
 
     def eventFilter(self, obj, event):
-        if obj is self.txt:
-            try:
-                from PyQt6.QtCore import QEvent
-                from PyQt6.QtGui import QKeySequence
-            except Exception:
-                return super().eventFilter(obj, event)
-            if event.type() == QEvent.Type.KeyPress:
-                if event.matches(QKeySequence.StandardKey.Paste):
-                    self._handle_paste_from_clipboard()
-                    return True
+        if obj is self.txt and event.type() == _KEYPRESS:
+            if event.matches(_PASTE_KEY):
+                self._handle_paste_from_clipboard()
+                return True
         return super().eventFilter(obj, event)
 
     def _paste(self):
         self._handle_paste_from_clipboard()
 
     def _handle_paste_from_clipboard(self):
-        from PyQt6.QtWidgets import QApplication
-
-        txt = (QApplication.clipboard().text() or "").strip()
-        if not txt:
+        md = QApplication.clipboard().mimeData()
+        if md is None or not md.hasText():
+            return
+        # URLs are short; bound the copy when a large document is on the clipboard
+        txt = (md.text() or "")[:4096].strip()
+        if not txt or txt == self.txt.text():
             return
         self.txt.setText(txt)
         self._process_text(txt, trigger="paste")
@@ -277,7 +412,7 @@ class Step1LinkWidget(QWidget):
 
     def _do_debounced_search(self):
         q = self.txt.text().strip()
-        if not q or YOUTUBE_URL_RE.match(q):
+        if not q or q.startswith(URL_PREFIXES):
             return
         self._start_fetch(f"ytsearch20:{q}")
 
@@ -293,9 +428,14 @@ class Step1LinkWidget(QWidget):
         text = (text or "").strip()
         if not text:
             return
-        is_url = bool(YOUTUBE_URL_RE.match(text))
+        # Typed search terms almost never start with a scheme; skip the regex
+        is_url = text.startswith(URL_PREFIXES) and bool(YOUTUBE_URL_RE.match(text))
         if is_url:
-            kind, norm = self._classify_url(text)
+            # Other sites go to yt-dlp as typed; only YouTube needs normalizing
+            if YT_URL_RE.fullmatch(text):
+                kind, norm = self._classify_url(text)
+            else:
+                kind, norm = "unknown", text
             self._handle_url(kind, norm)
             return
 
@@ -309,12 +449,15 @@ class Step1LinkWidget(QWidget):
             return
 
         # Auto search with debounce (single control)
-        secs = max(0, int(getattr(self.settings.ui, "search_debounce_seconds", 3)))
+        secs = max(
+            0.0, float(getattr(self.settings.ui, "search_debounce_seconds", 0.5))
+        )
         if not hasattr(self, "search_timer"):
             self.search_timer = QTimer(self)
             self.search_timer.setSingleShot(True)
             self.search_timer.timeout.connect(self._do_debounced_search)
-        self.search_timer.start(secs * 1000)
+        # Restarted on every keystroke, so it only fires once typing pauses
+        self.search_timer.start(int(secs * 1000))
 
     def _handle_url(self, kind: str, norm: str):
         if kind == "radio":
@@ -327,11 +470,15 @@ class Step1LinkWidget(QWidget):
             return
         self._start_fetch(norm)
 
-    def _classify_url(self, url: str) -> Tuple[str, str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=128)  # same text is re-classified on every edit
+    def _classify_url(url: str) -> Tuple[str, str]:
         """
         Returns (kind, normalized_url)
         kind: 'single' | 'playlist' | 'radio' | 'unknown'
         """
+        if not url.startswith(URL_PREFIXES):
+            return "unknown", url
         try:
             u = urlparse(url)
             if u.netloc not in VIDEO_HOSTS:
@@ -346,14 +493,10 @@ class Step1LinkWidget(QWidget):
                 if lst:
                     # normalize to watch with v+list
                     qs = urlencode({"v": vid, "list": lst}, doseq=True)
-                    return "playlist", urlunparse(
-                        ("https", "www.youtube.com", "/watch", "", qs, "")
-                    )
+                    return "playlist", urlunparse(_WATCH_PARTS + (qs, ""))
                 # single
                 qs = urlencode({"v": vid}, doseq=True)
-                return "single", urlunparse(
-                    ("https", "www.youtube.com", "/watch", "", qs, "")
-                )
+                return "single", urlunparse(_WATCH_PARTS + (qs, ""))
             # shorts
             if u.path.startswith("/shorts/"):
                 vid = u.path.split("/")[-1]
@@ -361,31 +504,32 @@ class Step1LinkWidget(QWidget):
                 return "single", urlunparse(
                     (u.scheme or "https", "www.youtube.com", "/watch", "", qs, "")
                 )
-            # standard watch
+            # standard watch: IDs are URL-safe, so split the query directly
+            # instead of decoding with parse_qs and re-encoding with urlencode
             if u.path == "/watch":
-                q = parse_qs(u.query or "")
-                lst = (q.get("list") or [""])[0]
+                q: Dict[str, str] = {}
+                for kv in u.query.split("&"):
+                    k, _, val = kv.partition("=")
+                    if val:
+                        q.setdefault(k, val)  # first non-blank wins, as parse_qs()[0]
+                v = q.get("v")
+                lst = q.get("list")
                 if lst:
-                    if lst.startswith("RD") or (q.get("start_radio", ["0"])[0] == "1"):
+                    if lst.startswith("RD") or q.get("start_radio") == "1":
                         return "radio", url
                     # keep only v+list for playlist fetch
-                    keep = {}
-                    if "v" in q:
-                        keep["v"] = q["v"]
-                    keep["list"] = [lst]
-                    qs = urlencode(keep, doseq=True)
+                    qs = f"v={v}&list={lst}" if v else f"list={lst}"
                     return "playlist", urlunparse(
                         (u.scheme, u.netloc, u.path, u.params, qs, u.fragment)
                     )
                 # single: keep v(+t)
-                keep = {}
-                if "v" in q:
-                    keep["v"] = q["v"]
-                if "t" in q:
-                    keep["t"] = q["t"]
-                qs = urlencode(keep, doseq=True)
+                keep = []
+                if v:
+                    keep.append(f"v={v}")
+                if q.get("t"):
+                    keep.append(f"t={q['t']}")
                 return "single", urlunparse(
-                    (u.scheme, u.netloc, u.path, u.params, qs, u.fragment)
+                    (u.scheme, u.netloc, u.path, u.params, "&".join(keep), u.fragment)
                 )
         except Exception:
             return "unknown", url
@@ -394,37 +538,48 @@ class Step1LinkWidget(QWidget):
     # ----- Fetch and Queue Management -----
 
     def _start_fetch(self, url: str):
-        if self.fetcher and self.fetcher.isRunning():
-            # If a fetch is in progress, handle queuing
-            if url.startswith("ytsearch"):
-                self._queued_search = url  # Only keep latest search
-                self.lbl_status.setText("Queued latest search...")
-            else:
-                self._queue.append(url)  # Queue non-search URLs in order
-                self.lbl_status.setText("Queued request...")
+        is_search = url.startswith("ytsearch")
+        if is_search:
+            self._gen += 1
+            self._desired_url = url  # Only keep latest search
+            self._cancel_fetch()  # in-flight search is now stale
+        else:
+            self._queue.append(url)  # Queue non-search URLs in order
+        if len(self._inflight) >= FETCH_MAX_PARALLEL:
+            self.lbl_status.setText(
+                "Queued latest search..." if is_search else "Queued request..."
+            )
             return
+        self._run_pending_if_any()
 
+    def _launch_fetch(self, url: str, gen: int):
         self.lbl_status.setText(
             "Searching..." if url.startswith("ytsearch") else "Fetching info..."
         )
         self._set_busy(True)
-        self.fetcher = InfoFetcher(url)
-        req_id = self._active_req_id = self._active_req_id + 1
-
-        self.fetcher.finished_ok.connect(
-            lambda info, rid=req_id: self._on_fetch_ok(rid, info)
-        )
-        self.fetcher.finished_fail.connect(
-            lambda err, rid=req_id: self._on_fetch_fail(rid, err)
-        )
-        self.fetcher.start()
-
-    def _on_fetch_ok(self, rid: int, info: Dict):
-        # Ignore stale responses
-        if rid != self._active_req_id:
+        f = InfoFetcher(url)
+        # Parent owns the thread until it has really finished
+        f.setParent(self)
+        f.finished.connect(f.deleteLater)
+        f.finished_ok.connect(lambda info, g=gen, f=f: self._on_fetch_ok(g, info, f))
+        f.finished_fail.connect(lambda err, g=gen, f=f: self._on_fetch_fail(g, err, f))
+        self._inflight.add(f)
+        f.start()
+
+    def _fetch_done(self, fetcher: Optional[InfoFetcher]):
+        self._inflight.discard(fetcher)
+        self._set_busy(bool(self._inflight))
+
+    def _is_stale(self, gen: int) -> bool:
+        # gen 0 marks explicit URL fetches, which are never superseded
+        return gen != 0 and gen != self._gen
+
+    def _on_fetch_ok(self, gen: int, info: Dict, fetcher: Optional[InfoFetcher] = None):
+        self._fetch_done(fetcher)
+        # Ignore stale responses (a newer search is pending)
+        if self._is_stale(gen):
+            self._run_pending_if_any()
             return
-        self.fetcher = None
-        self._set_busy(False)
 
         # Clear input if requested (use unified setting only)
         try:
@@ -439,43 +594,40 @@ class Step1LinkWidget(QWidget):
             info.get("_type") == "playlist"
             and info.get("extractor_key") == "YoutubeSearch"
         ):
-            self.results.clear()
-            entries = info.get("entries") or []
-            for i, e in enumerate(entries):
-                title = e.get("title") or "Unknown title"
-                url = e.get("webpage_url") or e.get("url") or ""
-                thumb = e.get("thumbnail") or (e.get("thumbnails") or [{}])[-1].get(
-                    "url"
-                )
-                it = QListWidgetItem(title)
-                it.setData(
-                    Qt.ItemDataRole.UserRole,
-                    {
-                        "title": title,
-                        "webpage_url": url,
-                        "url": url,
-                        "thumbnail": e.get("thumbnail"),
-                        "thumbnails": e.get("thumbnails"),
-                    },
-                )
-                # Defer thumbnail loading
-                if thumb:
-                    worker = Step1LinkWidget._ThumbWorker(i, thumb, self)
-                    worker.done.connect(
-                        lambda row, px, expected=thumb: self._set_result_icon_if_match(
-                            row, px, expected
-                        )
+            # Build all rows first and repaint once; avoids a relayout per row
+            self.results.setUpdatesEnabled(False)
+            try:
+                self.results.clear()
+                entries = info.get("entries") or []
+                for i, e in enumerate(entries):
+                    title = e.get("title") or "Unknown title"
+                    url = self._key(e) or ""
+                    thumb = thumb_cache.thumb_url(e)
+                    it = QListWidgetItem(title)
+                    it.setIcon(self._placeholder_icon)
+                    it.setData(
+                        _USER_ROLE,
+                        {
+                            "title": title,
+                            "webpage_url": url,
+                            "url": url,
+                            _KEY: url,
+                            "thumbnail": e.get("thumbnail"),
+                            "thumbnails": e.get("thumbnails"),
+                        },
                     )
-                    worker.finished.connect(
-                        lambda w=worker: (
-                            self._thumb_threads.remove(w)
-                            if w in self._thumb_threads
-                            else None
+                    self.results.addItem(it)
+                    # Defer thumbnail loading
+                    if thumb:
+                        self._start_thumb(
+                            i,
+                            thumb,
+                            lambda row, px, _gray, expected: self._set_result_icon_if_match(
+                                row, px, expected
+                            ),
                         )
-                    )
-                    self._thumb_threads.append(worker)
-                    worker.start()
-                self.results.addItem(it)
+            finally:
+                self.results.setUpdatesEnabled(True)
             self.tabs.setCurrentIndex(self.idx_search)
             self._run_pending_if_any()
             return
@@ -486,38 +638,43 @@ class Step1LinkWidget(QWidget):
                 f"Loaded playlist with {len(info.get('entries') or [])} videos."
             )
             self.playlist_list.clear()
+            self._playlist_items_by_url.clear()
+            self._playlist_entries_by_url.clear()
             self.chk_pl_select_all.blockSignals(True)
             self.chk_pl_select_all.setChecked(False)
             self.chk_pl_select_all.blockSignals(False)
-            for e in info.get("entries") or []:
-                if not e:
-                    continue
-                title = e.get("title") or "Untitled"
-                it = QListWidgetItem(title)
-                it.setData(Qt.ItemDataRole.UserRole, e)
-                # Async thumb fetch to avoid blocking UI
-                thumb = e.get("thumbnail") or (e.get("thumbnails") or [{}])[-1].get(
-                    "url"
-                )
-                if thumb:
-                    vurl = (e.get("webpage_url") or e.get("url")) or ""
-                    worker = Step1LinkWidget._ThumbWorker(-1, thumb, self)
-                    worker.done.connect(
-                        lambda _row, px, _thumb_url, v=vurl: self._set_playlist_icon_for_url(
-                            v, px
-                        )
+            self.playlist_list.setUpdatesEnabled(False)
+            try:
+                for e in info.get("entries") or []:
+                    if not e:
+                        continue
+                    title = e.get("title") or "Untitled"
+                    it = QListWidgetItem(title)
+                    it.setIcon(self._placeholder_icon)
+                    vurl = self._key(e)
+                    if vurl:
+                        e[_KEY] = vurl
+                    it.setData(_USER_ROLE, e)
+                    self._style_playlist_item(
+                        it, bool(vurl) and vurl in self._selected_by_url
                     )
-                    worker.finished.connect(
-                        lambda w=worker: (
-                            self._thumb_threads.remove(w)
-                            if w in self._thumb_threads
-                            else None
+                    if vurl:
+                        self._playlist_items_by_url[vurl] = it
+                        self._playlist_entries_by_url[vurl] = e
+                    self.playlist_list.addItem(it)
+                    # Async thumb fetch to avoid blocking UI
+                    thumb = thumb_cache.thumb_url(e)
+                    if thumb and vurl:
+                        self._start_thumb(
+                            -1,
+                            thumb,
+                            lambda _row, px, gray, _thumb_url, v=vurl: self._set_playlist_icon_for_url(
+                                v, px, gray
+                            ),
+                            gray=True,
                         )
-                    )
-                    self._thumb_threads.append(worker)
-                    worker.start()
-                self._style_playlist_item(it, self._is_selected(e))
-                self.playlist_list.addItem(it)
+            finally:
+                self.playlist_list.setUpdatesEnabled(True)
             self.tabs.setTabVisible(self.idx_playlist, True)
             self.tabs.setCurrentIndex(self.idx_playlist)
             self.chk_pl_select_all.setVisible(self.chk_multi.isChecked())  # NEW
@@ -534,12 +691,12 @@ class Step1LinkWidget(QWidget):
             self._upsert_selected(info)
         self._run_pending_if_any()
 
-    def _on_fetch_fail(self, rid: int, err: str):
+    def _on_fetch_fail(self, gen: int, err: str, fetcher: Optional[InfoFetcher] = None):
+        self._fetch_done(fetcher)
         # Ignore stale failures
-        if rid != self._active_req_id:
+        if self._is_stale(gen):
+            self._run_pending_if_any()
             return
-        self.fetcher = None
-        self._set_busy(False)
         self.lbl_status.setText(f"Error: {err}")
         try:
             QMessageBox.warning(self, "Fetch failed", str(err))
@@ -548,49 +705,78 @@ class Step1LinkWidget(QWidget):
         self._run_pending_if_any()
 
     def _run_pending_if_any(self):
-        # Process pending requests - newest search first, then FIFO queue
-        next_url = None
-        if self._queued_search:
-            next_url = self._queued_search
-            self._queued_search = None
-        elif self._queue:
-            next_url = self._queue.popleft()
-        if next_url:
-            self._start_fetch(next_url)
+        # Fill free slots - newest search first, then FIFO queue
+        while len(self._inflight) < FETCH_MAX_PARALLEL:
+            if self._desired_url:
+                url, self._desired_url = self._desired_url, None
+                self._launch_fetch(url, self._gen)
+            elif self._queue:
+                self._launch_fetch(self._queue.popleft(), 0)
+            else:
+                break
 
     def _cancel_fetch(self):
-        # No-op: don't force-terminate fetches to avoid crashes
-        pass
+        # Only searches get superseded; explicit URLs always run to completion.
+        # cancel() is cooperative (kills the yt-dlp process, no terminate()),
+        # and the fetcher still reports back so the queue keeps moving.
+        for f in self._inflight:
+            if f.url.startswith("ytsearch"):
+                f.cancel()
 
     # ----- Selection Management -----
 
     def _is_selected(self, info: Dict) -> bool:
-        url = (info or {}).get("webpage_url") or (info or {}).get("url")
-        if not url:
+        if not info:
             return False
-        return any(
-            (it.get("webpage_url") or it.get("url")) == url for it in self.selected
-        )
+        url = self._key(info)
+        return bool(url) and url in self._selected_by_url
+
+    def _reindex_selected(self):
+        self._selected_by_url = {it[_KEY]: i for i, it in enumerate(self.selected)}
+
+    def _remove_selected(self, url: str):
+        # Delete in place and shift later indices instead of rebuilding the list
+        idx = self._selected_by_url.pop(url, None)
+        if idx is None:
+            return
+        del self.selected[idx]
+        for k, v in self._selected_by_url.items():
+            if v > idx:
+                self._selected_by_url[k] = v - 1
+        self._selected_items.pop(url, None)
+        # Rows mirror self.selected, so the same index is the row to drop.
+        # A pending rebuild will redo the whole list anyway.
+        if not self._refresh_timer.isActive():
+            self.selected_list.takeItem(idx)
+        self.tabs.setTabVisible(self.idx_selected, len(self.selected) > 0)
 
     def _upsert_selected(self, info: Dict):
         if not isinstance(info, dict):
             return
-        url = info.get("webpage_url") or info.get("url")
+        url = self._key(info)
         if not url:
             return
-        idx = next(
-            (
-                i
-                for i, it in enumerate(self.selected)
-                if (it.get("webpage_url") or it.get("url")) == url
-            ),
-            -1,
-        )
-        if idx >= 0:
-            self.selected[idx] = {**self.selected[idx], **info}
+        idx = self._selected_by_url.get(url)
+        if idx is not None:
+            self.selected[idx].update(info)
+            self._update_selected_item(url)
         else:
+            info[_KEY] = url
+            self._selected_by_url[url] = len(self.selected)
             self.selected.append(info)
-        self._refresh_selected_list()
+            if not self._refresh_timer.isActive():
+                self.selected_list.addItem(self._new_selected_item(info))
+            self.tabs.setTabVisible(self.idx_selected, True)
+
+    def _update_selected_item(self, url: str):
+        # Merged metadata may bring a real title; refresh just that row
+        lw = self._selected_items.get(url)
+        idx = self._selected_by_url.get(url)
+        if lw is None or idx is None:
+            return
+        it = self.selected[idx]
+        lw.setText(it.get("title") or "Untitled")
+        lw.setData(_USER_ROLE, it)
 
     # --- UI lock helper during confirm ---
     def _set_ui_enabled(self, enabled: bool):
@@ -616,7 +802,7 @@ class Step1LinkWidget(QWidget):
         urls = []
         for it in list(self.selected):
             if not _has_formats(it):
-                u = (it or {}).get("webpage_url") or (it or {}).get("url")
+                u = it[_KEY]
                 if u:
                     urls.append(u)
 
@@ -664,31 +850,28 @@ class Step1LinkWidget(QWidget):
                 self.btn_next.setEnabled(True)
                 self.selectionConfirmed.emit(list(self.selected))
 
-        # Launch parallel fetchers keyed by URL to avoid index drift
-        for u in urls:
-            f = InfoFetcher(u)
-
-            def _ok(meta: dict, url=u):
-                try:
-                    if isinstance(meta, dict):
-                        # merge into the matching selected item by URL if still present
-                        for i, s in enumerate(list(self.selected)):
-                            surl = (s or {}).get("webpage_url") or (s or {}).get("url")
-                            if surl == url:
-                                self.selected[i] = {**s, **meta}
-                                break
-                        self._refresh_selected_list()
-                finally:
-                    self._confirm_fetchers.pop(url, None)
-                    _on_done_one()
-
-            def _fail(_: str, url=u):
-                self._confirm_fetchers.pop(url, None)
+        def _ok(url: str, meta: dict):
+            try:
+                if isinstance(meta, dict):
+                    # merge into the matching selected item by URL if still present
+                    i = self._selected_by_url.get(url)
+                    if i is not None:
+                        self.selected[i].update(meta)
+                        self._update_selected_item(url)
+            finally:
                 _on_done_one()
 
-            f.finished_ok.connect(_ok)
-            f.finished_fail.connect(_fail)
-            self._confirm_fetchers[u] = f
+        # Split URLs round-robin over at most CONFIRM_MAX_PARALLEL batches; each
+        # batch shares one extractor session. Results are keyed by URL, not index.
+        n = min(CONFIRM_MAX_PARALLEL, len(urls))
+        for b in range(n):
+            f = BatchInfoFetcher(urls[b::n])
+            f.setParent(self)
+            f.itemOk.connect(_ok)
+            f.itemFail.connect(lambda _url, _err: _on_done_one())
+            f.finished.connect(lambda b=b: self._confirm_fetchers.pop(b, None))
+            f.finished.connect(f.deleteLater)
+            self._confirm_fetchers[b] = f
             f.start()
 
     # --- Multi toggle: also hide/show playlist "Select all" ---
@@ -705,13 +888,16 @@ class Step1LinkWidget(QWidget):
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             )
             if res == QMessageBox.StandardButton.Yes:
+                was_selected = list(self._selected_by_url)
                 self.selected.clear()
+                self._selected_by_url.clear()
                 self._refresh_selected_list()
                 self.tabs.setTabVisible(self.idx_selected, False)
-                # Reset playlist item styling
-                for i in range(self.playlist_list.count()):
-                    it = self.playlist_list.item(i)
-                    self._style_playlist_item(it, False)
+                # Reset styling of just the playlist rows that were selected
+                for url in was_selected:
+                    it = self._playlist_items_by_url.get(url)
+                    if it is not None:
+                        self._style_playlist_item(it, False)
                 self.lbl_status.setText("")
             else:
                 # Revert to ON
@@ -723,8 +909,8 @@ class Step1LinkWidget(QWidget):
 
     # Toggle a playlist entry in/out of selection
     def _toggle_from_playlist(self, item: QListWidgetItem):
-        info = item.data(Qt.ItemDataRole.UserRole) or {}
-        url = info.get("webpage_url") or info.get("url")
+        info = item.data(_USER_ROLE) or {}
+        url = self._key(info)
         if not url:
             return
 
@@ -736,12 +922,7 @@ class Step1LinkWidget(QWidget):
                 )
                 == QMessageBox.StandardButton.Yes
             ):
-                self.selected = [
-                    it
-                    for it in self.selected
-                    if (it.get("webpage_url") or it.get("url")) != url
-                ]
-                self._refresh_selected_list()
+                self._remove_selected(url)
                 self._style_playlist_item(item, False)  # update styling
         else:
             if self.chk_multi.isChecked():
@@ -758,15 +939,28 @@ class Step1LinkWidget(QWidget):
     def reset(self):
         # Cancel any in-flight fetch
         self._cancel_fetch()
+        # Obsolete any in-flight search and drop pending ones
+        self._gen += 1
+        self._desired_url = None
         # Clear inputs and status
         self.txt.clear()
         self.lbl_status.setText("")
         self._set_busy(False)  # CHANGED
-        # Clear all lists
+        # Clear all lists (each clear() is one model reset); repaint once after
+        lists = (self.results, self.playlist_list, self.selected_list)
+        for lw in lists:
+            lw.setUpdatesEnabled(False)
         self.results.clear()
         self.playlist_list.clear()
+        self._playlist_items_by_url.clear()
+        self._playlist_entries_by_url.clear()
         self.selected.clear()
+        self._selected_by_url.clear()
+        self._refresh_timer.stop()
         self.selected_list.clear()
+        self._selected_items.clear()
+        for lw in lists:
+            lw.setUpdatesEnabled(True)
         # Hide tabs except search, uncheck toggles
         self.tabs.setCurrentWidget(self.tab_search)
         self.tabs.setTabVisible(self.idx_selected, False)
@@ -781,13 +975,19 @@ class Step1LinkWidget(QWidget):
         # Stop any pending search timer cleanly
         if hasattr(self, "search_timer"):
             self.search_timer.stop()
-        # Let thumb workers finish; icons will be ignored after list cleared
-        self._thumb_threads.clear()
+        # Drop queued thumb tasks and tell running ones to stop
+        self._thumb_stop.set()
+        self._thumb_stop = threading.Event()
+        Step1LinkWidget._THUMB_POOL.clear()
+        self._thumb_waiters.clear()
+        for reply in list(self._thumb_replies.values()):
+            reply.abort()
+        self._thumb_replies.clear()
 
     # Keep only one definition of this handler
     def _remove_from_selected_prompt(self, item: QListWidgetItem):
-        info = item.data(Qt.ItemDataRole.UserRole) or {}
-        url = info.get("webpage_url") or info.get("url")
+        info = item.data(_USER_ROLE) or {}
+        url = self._key(info)
         title = info.get("title") or "Untitled"
         if not url:
             return
@@ -797,20 +997,10 @@ class Step1LinkWidget(QWidget):
             )
             == QMessageBox.StandardButton.Yes
         ):
-            self.selected = [
-                it
-                for it in self.selected
-                if (it.get("webpage_url") or it.get("url")) != url
-            ]
-            self._refresh_selected_list()
-            for i in range(self.playlist_list.count()):
-                pit = self.playlist_list.item(i)
-                pdata = pit.data(Qt.ItemDataRole.UserRole) or {}
-                pu = pdata.get("webpage_url") or pdata.get("url")
-                if pu == url:
-                    self._style_playlist_item(pit, False)
-                    break
-            self.tabs.setTabVisible(self.idx_selected, self.selected_list.count() > 0)
+            self._remove_selected(url)
+            pit = self._playlist_items_by_url.get(url)
+            if pit is not None:
+                self._style_playlist_item(pit, False)
 
     # "Next" in multi-select mode: emit all selected infos
     def _confirm_selection(self):
@@ -821,37 +1011,117 @@ class Step1LinkWidget(QWidget):
         self._fetch_all_selected_then_emit()
 
     # ----- Thumbnail and Styling Helpers (ADDED) -----
-    def _load_thumb(self, url: str):
-        if not url:
+    # on_done(row, pixmap, gray pixmap or None, url); called right away on a cache hit
+    def _start_thumb(self, row: int, url: str, on_done, gray: bool = False):
+        pix = QPixmapCache.find(url)
+        if pix is not None:
+            on_done(row, pix, self._cached_gray(url, pix) if gray else None, url)
+            return
+        # Same URL already downloading (shared channel thumbs, reopened
+        # playlist): wait on that request instead of issuing another
+        waiters = self._thumb_waiters.get(url)
+        if waiters is not None:
+            waiters.append((row, on_done, gray))
+            return
+        self._thumb_waiters[url] = [(row, on_done, gray)]
+        # Fetched in an earlier run: decode straight from the disk cache
+        if thumb_cache.has(url):
+            self._decode_thumb(url, None, gray)
+            return
+        req = QNetworkRequest(QUrl(url))
+        req.setAttribute(QNetworkRequest.Attribute.Http2AllowedAttribute, True)
+        req.setTransferTimeout(5000)
+        reply = self._nam.get(req)
+        thumb_cache.cap_reply(reply)
+        self._thumb_replies[url] = reply
+        reply.finished.connect(lambda r=reply, u=url: self._on_thumb_reply(r, u))
+
+    def _on_thumb_reply(self, reply: QNetworkReply, url: str):
+        reply.deleteLater()
+        if self._thumb_replies.get(url) is reply:
+            del self._thumb_replies[url]
+        waiters = self._thumb_waiters.get(url)
+        data = thumb_cache.reply_bytes(reply)
+        if data is None:
+            self._on_thumb_failed(url)
+            return
+        if not waiters:
+            return  # dropped by reset()
+        # Decode (and gray-convert if any row wants it) off the GUI thread
+        self._decode_thumb(url, data, any(w[2] for w in waiters))
+
+    def _decode_thumb(self, url: str, data: Optional[bytes], gray: bool):
+        task = _ThumbTask(url, data, self._thumb_stop, gray, self.devicePixelRatioF())
+        task.signals.done.connect(self._on_thumb_done)
+        task.signals.failed.connect(self._on_thumb_failed)
+        Step1LinkWidget._THUMB_POOL.start(task)
+
+    def _on_thumb_done(self, img: QImage, gray: QImage, url: str):
+        pix = QPixmap.fromImage(img)
+        gpix = self._cache_thumb(url, pix, gray)
+        for row, on_done, want_gray in self._thumb_waiters.pop(url, ()):
+            if want_gray and gpix is None:
+                gpix = self._cached_gray(url, pix)
+            on_done(row, pix, gpix if want_gray else None, url)
+
+    def _on_thumb_failed(self, url: str):
+        # Let a later request retry instead of queueing behind a dead download
+        self._thumb_waiters.pop(url, None)
+
+    # Store a freshly loaded thumb (and its gray variant); returns the gray pixmap
+    def _cache_thumb(self, url: str, pix: QPixmap, gray: QImage):
+        QPixmapCache.insert(url, pix)
+        if gray.isNull():
             return None
-        try:
-            from urllib.request import urlopen
+        gpix = QPixmap.fromImage(gray, Qt.ImageConversionFlag.NoFormatConversion)
+        QPixmapCache.insert(url + _GRAY_SUFFIX, gpix)
+        return gpix
 
-            data = urlopen(url, timeout=5).read()
-            pix = QPixmap()
-            if pix.loadFromData(data):
-                return pix
-        except Exception:
-            pass
-        return None
+    def _cached_gray(self, url: str, pix: QPixmap) -> QPixmap:
+        gpix = QPixmapCache.find(url + _GRAY_SUFFIX)
+        if gpix is None:
+            gpix = self._to_gray(pix)
+            QPixmapCache.insert(url + _GRAY_SUFFIX, gpix)
+        return gpix
 
     def _to_gray(self, pix: QPixmap) -> QPixmap:
+        # Memoized per source pixmap, so repeated select-all passes reuse it
+        key = f"{_GRAY_SUFFIX}:{pix.cacheKey()}"
+        cached = QPixmapCache.find(key)
+        if cached is not None:
+            return cached
         try:
-            img = pix.toImage().convertToFormat(QImage.Format.Format_Grayscale8)
-            return QPixmap.fromImage(img)
+            img = pix.toImage()
+            gray = _gray_image(img)
+            if gray is img:
+                return pix
+            # Grayscale8 is directly drawable; don't let fromImage convert again
+            out = QPixmap.fromImage(gray, Qt.ImageConversionFlag.NoFormatConversion)
         except Exception:
             return pix
+        QPixmapCache.insert(key, out)
+        return out
 
     def _apply_icon_style(self, item: QListWidgetItem, selected: bool):
-        pix = item.data(ICON_PIXMAP_ROLE)
-        if isinstance(pix, QPixmap):
-            item.setIcon(QIcon(pix if selected else self._to_gray(pix)))
+        icon = item.data(ICON_COLOR_ICON_ROLE if selected else ICON_GRAY_ICON_ROLE)
+        if not isinstance(icon, QIcon) and not selected:
+            # Convert once per thumbnail; later toggles reuse the cached icon
+            src = item.data(ICON_PIXMAP_ROLE)
+            if not isinstance(src, QPixmap):
+                return
+            icon = QIcon(self._to_gray(src))
+            item.setData(ICON_GRAY_ICON_ROLE, icon)
+        if isinstance(icon, QIcon):
+            item.setIcon(icon)
 
     def _style_playlist_item(self, item: QListWidgetItem, selected: bool):
+        if item.data(STYLE_STATE_ROLE) == selected:
+            return  # already styled this way; avoid dirtying the model
+        item.setData(STYLE_STATE_ROLE, selected)
         if selected:
-            item.setForeground(QColor(self.settings.ui.accent_color_hex))
+            item.setForeground(self._col_accent)
         else:
-            item.setForeground(QColor("#8a8b90"))
+            item.setForeground(self._col_dim)
         self._apply_icon_style(item, selected)
 
     def _set_result_icon_if_match(self, row: int, pix: QPixmap, expected_url: str):
@@ -859,48 +1129,49 @@ class Step1LinkWidget(QWidget):
             if row < 0 or row >= self.results.count():
                 return
             it = self.results.item(row)
-            data = it.data(Qt.ItemDataRole.UserRole) or {}
-            current = data.get("thumbnail") or (data.get("thumbnails") or [{}])[-1].get(
-                "url"
-            )
+            data = it.data(_USER_ROLE) or {}
+            current = thumb_cache.thumb_url(data)
             if current != expected_url:
                 return  # item changed; skip
             it.setIcon(QIcon(pix))
             it.setData(ICON_PIXMAP_ROLE, pix)
         except Exception:
             pass
-        self._thumb_threads.clear()
 
     # NEW: set icon in playlist tab by video URL
-    def _set_playlist_icon_for_url(self, video_url: str, pix: QPixmap):
+    def _set_playlist_icon_for_url(
+        self, video_url: str, pix: QPixmap, gray: Optional[QPixmap] = None
+    ):
         try:
-            for i in range(self.playlist_list.count()):
-                item = self.playlist_list.item(i)
-                data = item.data(Qt.ItemDataRole.UserRole) or {}
-                u = (data.get("webpage_url") or data.get("url")) or ""
-                if u == video_url:
-                    item.setIcon(QIcon(pix))
-                    item.setData(ICON_PIXMAP_ROLE, pix)
-                    # keep current selected/gray style
-                    self._apply_icon_style(item, self._is_selected(data))
-                    break
+            item = self._playlist_items_by_url.get(video_url)
+            if item is None:
+                return
+            item.setData(ICON_PIXMAP_ROLE, pix)
+            item.setData(ICON_COLOR_ICON_ROLE, QIcon(pix))
+            # Gray variant precomputed by the worker/cache; otherwise built lazily
+            item.setData(ICON_GRAY_ICON_ROLE, QIcon(gray) if gray is not None else None)
+            # keep current selected/gray style
+            self._apply_icon_style(item, video_url in self._selected_by_url)
         except Exception:
             pass
 
     # NEW: set icon in selected tab by video URL
     def _set_selected_icon_for_url(self, video_url: str, pix: QPixmap):
         try:
-            for i in range(self.selected_list.count()):
-                item = self.selected_list.item(i)
-                data = item.data(Qt.ItemDataRole.UserRole) or {}
-                u = (data.get("webpage_url") or data.get("url")) or ""
-                if u == video_url:
-                    item.setIcon(QIcon(pix))
-                    item.setData(ICON_PIXMAP_ROLE, pix)
-                    break
+            item = self._selected_items.get(video_url)
+            if item is not None:
+                item.setIcon(QIcon(pix))
+                item.setData(ICON_PIXMAP_ROLE, pix)
         except Exception:
             pass
 
+    # Called by MainWindow when the accent color changes
+    def apply_accent(self, hex_color: str):
+        self._col_accent = QColor(hex_color)
+        for url, it in self._playlist_items_by_url.items():
+            if url in self._selected_by_url:
+                it.setForeground(self._col_accent)
+
     # Allow MainWindow to enable/disable Next and optionally show a hint
     def set_next_enabled(self, enabled: bool, note: str = ""):
         try:
@@ -913,179 +1184,58 @@ class Step1LinkWidget(QWidget):
     # NEW: handler for the "Select all" checkbox in the playlist tab
     def _on_pl_select_all_toggled(self, checked: bool):
         # Select/deselect all playlist entries, updating self.selected accordingly.
+        # Nothing to do if every row (or no row) already has the target state
+        n_sel = len(self._playlist_items_by_url.keys() & self._selected_by_url.keys())
+        if n_sel == (len(self._playlist_items_by_url) if checked else 0):
+            return
+        # Restyling emits dataChanged per row; mute the model and repaint once.
+        model = self.playlist_list.model()
+        model.blockSignals(True)
         self.playlist_list.setUpdatesEnabled(False)
         try:
             if checked:
-                for i in range(self.playlist_list.count()):
-                    it = self.playlist_list.item(i)
-                    e = it.data(Qt.ItemDataRole.UserRole) or {}
-                    u = e.get("webpage_url") or e.get("url")
-                    if not u:
-                        continue
-                    idx = next(
-                        (
-                            k
-                            for k, s in enumerate(self.selected)
-                            if (s.get("webpage_url") or s.get("url")) == u
-                        ),
-                        -1,
-                    )
-                    if idx >= 0:
-                        self.selected[idx] = {**self.selected[idx], **e}
+                for u, it in self._playlist_items_by_url.items():
+                    e = self._playlist_entries_by_url[u]
+                    idx = self._selected_by_url.get(u)
+                    if idx is not None:
+                        self.selected[idx].update(e)
                     else:
-                        self.selected.append(e)
+                        self._selected_by_url[u] = len(self.selected)
+                        self.selected.append({**e, _KEY: u})
                     self._style_playlist_item(it, True)
             else:
                 # Remove any selected item that belongs to this playlist view
-                urls = []
-                for i in range(self.playlist_list.count()):
-                    it = self.playlist_list.item(i)
-                    e = it.data(Qt.ItemDataRole.UserRole) or {}
-                    u = e.get("webpage_url") or e.get("url")
-                    if not u:
-                        continue
-                    urls.append(u)
+                for it in self._playlist_items_by_url.values():
                     self._style_playlist_item(it, False)
-                urlset = set(urls)
-                self.selected = [
-                    s
-                    for s in self.selected
-                    if (s.get("webpage_url") or s.get("url")) not in urlset
-                ]
+                # Only filter/reindex when some playlist row is actually selected
+                urlset = (
+                    self._playlist_items_by_url.keys() & self._selected_by_url.keys()
+                )
+                if urlset:
+                    self.selected = [s for s in self.selected if s[_KEY] not in urlset]
+                    self._reindex_selected()
             self._refresh_selected_list()
-            self.tabs.setTabVisible(self.idx_selected, self.selected_list.count() > 0)
+            self.tabs.setTabVisible(self.idx_selected, len(self.selected) > 0)
         finally:
+            model.blockSignals(False)
             self.playlist_list.setUpdatesEnabled(True)
-            self._thumb_threads.clear()
-
-    # "Next" in multi-select mode: emit all selected infos
-    def _confirm_selection(self):
-        if not self.selected:
-            QMessageBox.information(self, "No videos", "No videos selected.")
-            return
-        # Ensure all selected have metadata before emitting
-        self._fetch_all_selected_then_emit()
-
-    def set_next_enabled(self, enabled: bool, note: str = ""):
-        try:
-            self.btn_next.setEnabled(enabled)
-            if note is not None:
-                self.lbl_status.setText(note)
-        except Exception:
-            pass
-            return
-        if self.selected:
-            res = QMessageBox.question(
-                self,
-                "Clear selected",
-                "Are you sure you want to clear videos?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            )
-            if res == QMessageBox.StandardButton.Yes:
-                self.selected.clear()
-                self._refresh_selected_list()
-                self.tabs.setTabVisible(self.idx_selected, False)
-                # Reset playlist item styling
-                for i in range(self.playlist_list.count()):
-                    it = self.playlist_list.item(i)
-                    self._style_playlist_item(it, False)
-                self.lbl_status.setText("")
-            else:
-                # Revert to ON
-                self.chk_multi.blockSignals(True)
-                self.chk_multi.setChecked(True)
-                self.chk_multi.blockSignals(False)
-
-    # Show Next only when multi is enabled; confirm clear when disabling
-    # (already defined above, removed duplicate)
-
-    def reset(self):
-        # Cancel any in-flight fetch
-        self._cancel_fetch()
-        # Clear inputs and status
-        self.txt.clear()
-        self.lbl_status.setText("")
-        self._set_busy(False)  # CHANGED
-        # Clear all lists
-        self.results.clear()
-        self.playlist_list.clear()
-        self.selected.clear()
-        self.selected_list.clear()
-        # Hide tabs except search, uncheck toggles
-        self.tabs.setCurrentWidget(self.tab_search)
-        self.tabs.setTabVisible(self.idx_selected, False)
-        self.tabs.setTabVisible(self.idx_playlist, False)
-        self.chk_pl_select_all.blockSignals(True)
-        self.chk_pl_select_all.setChecked(False)
-        self.chk_pl_select_all.blockSignals(False)
-        self.chk_multi.blockSignals(True)
-        self.chk_multi.setChecked(False)
-        self.chk_multi.blockSignals(False)
-        self.btn_next.setVisible(False)
-        # Stop any pending search timer cleanly
-        if hasattr(self, "search_timer"):
-            self.search_timer.stop()
-        # Let thumb workers finish; icons will be ignored after list cleared
-        self._thumb_threads.clear()
-
-    # Keep only one definition of this handler
-    def _remove_from_selected_prompt(self, item: QListWidgetItem):
-        info = item.data(Qt.ItemDataRole.UserRole) or {}
-        url = info.get("webpage_url") or info.get("url")
-        title = info.get("title") or "Untitled"
-        if not url:
-            return
-        if (
-            QMessageBox.question(
-                self, "Remove video", f"Remove '{title}' from selected?"
-            )
-            == QMessageBox.StandardButton.Yes
-        ):
-            self.selected = [
-                it
-                for it in self.selected
-                if (it.get("webpage_url") or it.get("url")) != url
-            ]
-            self._refresh_selected_list()
-            for i in range(self.playlist_list.count()):
-                pit = self.playlist_list.item(i)
-                pdata = pit.data(Qt.ItemDataRole.UserRole) or {}
-                pu = pdata.get("webpage_url") or pdata.get("url")
-                if pu == url:
-                    self._style_playlist_item(pit, False)
-                    break
-            self.tabs.setTabVisible(self.idx_selected, self.selected_list.count() > 0)
-
-    # "Next" in multi-select mode: emit all selected infos
-    def _confirm_selection(self):
-        if not self.selected:
-            QMessageBox.information(self, "No videos", "No videos selected.")
-            return
-        self._fetch_all_selected_then_emit()
+            self.playlist_list.viewport().update()
 
     def _toggle_from_results(self, item: QListWidgetItem):
-        data = item.data(Qt.ItemDataRole.UserRole) or {}
-        url = data.get("webpage_url") or data.get("url")
+        data = item.data(_USER_ROLE) or {}
+        url = self._key(data)
         title = data.get("title") or "Unknown title"
         if not url:
             return
-        idx = next(
-            (
-                i
-                for i, it in enumerate(self.selected)
-                if (it.get("webpage_url") or it.get("url")) == url
-            ),
-            -1,
-        )
-        if idx >= 0:
+        idx = self._selected_by_url.get(url)
+        if idx is not None:
             if (
                 QMessageBox.question(
                     self, "Remove video", f"Remove '{title}' from selected?"
                 )
                 == QMessageBox.StandardButton.Yes
             ):
-                self.selected.pop(idx)
-                self._refresh_selected_list()
+                self._remove_selected(url)
             return
         if self.chk_multi.isChecked():
             # Multi: just add placeholder, do not fetch metadata now
@@ -1103,67 +1253,3 @@ class Step1LinkWidget(QWidget):
             # Single: fetch metadata and proceed
             self.lbl_status.setText("Fetching info...")
             self._start_fetch(url)
-
-    # NEW: handler for the "Select all" checkbox in the playlist tab
-    def _on_pl_select_all_toggled(self, checked: bool):
-        # Select/deselect all playlist entries, updating self.selected accordingly.
-        self.playlist_list.setUpdatesEnabled(False)
-        try:
-            if checked:
-                for i in range(self.playlist_list.count()):
-                    it = self.playlist_list.item(i)
-                    e = it.data(Qt.ItemDataRole.UserRole) or {}
-                    u = e.get("webpage_url") or e.get("url")
-                    if not u:
-                        continue
-                    idx = next(
-                        (
-                            k
-                            for k, s in enumerate(self.selected)
-                            if (s.get("webpage_url") or s.get("url")) == u
-                        ),
-                        -1,
-                    )
-                    if idx >= 0:
-                        self.selected[idx] = {**self.selected[idx], **e}
-                    else:
-                        self.selected.append(e)
-                    self._style_playlist_item(it, True)
-            else:
-                # Remove any selected item that belongs to this playlist view
-                urls = []
-                for i in range(self.playlist_list.count()):
-                    it = self.playlist_list.item(i)
-                    e = it.data(Qt.ItemDataRole.UserRole) or {}
-                    u = e.get("webpage_url") or e.get("url")
-                    if not u:
-                        continue
-                    urls.append(u)
-                    self._style_playlist_item(it, False)
-                urlset = set(urls)
-                self.selected = [
-                    s
-                    for s in self.selected
-                    if (s.get("webpage_url") or s.get("url")) not in urlset
-                ]
-            self._refresh_selected_list()
-            self.tabs.setTabVisible(self.idx_selected, self.selected_list.count() > 0)
-        finally:
-            self.playlist_list.setUpdatesEnabled(True)
-            self._thumb_threads.clear()
-
-    # "Next" in multi-select mode: emit all selected infos
-    def _confirm_selection(self):
-        if not self.selected:
-            QMessageBox.information(self, "No videos", "No videos selected.")
-            return
-        # Ensure all selected have metadata before emitting
-        self._fetch_all_selected_then_emit()
-
-    def set_next_enabled(self, enabled: bool, note: str = ""):
-        try:
-            self.btn_next.setEnabled(enabled)
-            if note is not None:
-                self.lbl_status.setText(note)
-        except Exception:
-            pass
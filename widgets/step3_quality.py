@@ -1,4 +1,5 @@
-from typing import List, Dict
+import time
+from typing import List, Dict, Optional
 from PyQt6.QtCore import (
     Qt,
     pyqtSignal,
@@ -9,11 +10,16 @@ from PyQt6.QtCore import (
     QAbstractAnimation,
     QEvent,
     QObject,
+    QPoint,
+    QRunnable,
+    QThreadPool,
+    QUrl,
 )
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
+    QFormLayout,
     QComboBox,
     QPushButton,
     QLabel,
@@ -23,11 +29,57 @@ from PyQt6.QtWidgets import (
     QFrame,
     QGraphicsOpacityEffect,  # CHANGED: moved here from QtGui
 )
-from PyQt6.QtGui import QIcon, QPixmap  # CHANGED: removed QGraphicsOpacityEffect
-
+from PyQt6.QtGui import (
+    QIcon,
+    QImage,
+    QPixmap,
+    QPixmapCache,
+)  # CHANGED: removed QGraphicsOpacityEffect
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
+
+from core import thumb_cache
 from core.settings import AppSettings, SettingsManager
 from core.yt_manager import InfoFetcher
 
+_THUMB_URL_ROLE = Qt.ItemDataRole.UserRole
+THUMB_PREFETCH_ROWS = 2  # rows above/below the viewport loaded ahead of scrolling
+FADE_MAX_ITEMS = 20  # larger lists skip the (offscreen-composited) fade-in
+THUMB_RETRY_S = 30  # a failed thumbnail isn't requested again before this
+
+
+class _PreviewThumbSignals(QObject):
+    loaded = pyqtSignal(int, str, QImage)  # gen, url, image
+    failed = pyqtSignal(int, str)  # gen, url
+
+
+# Decodes downloaded (or disk-cached, data=None) bytes off the GUI thread
+class _PreviewThumbTask(QRunnable):
+    def __init__(self, gen: int, url: str, data: Optional[bytes], dpr: float):
+        super().__init__()
+        self.gen = gen
+        self.url = url
+        self.data = data
+        self.dpr = dpr
+        self.signals = _PreviewThumbSignals()
+
+    def run(self):
+        try:
+            data = self.data
+            from_disk = data is None
+            if from_disk:
+                data = thumb_cache.load_bytes(self.url)
+            img = thumb_cache.decode_icon(data, self.dpr) if data else QImage()
+            if not img.isNull():
+                if not from_disk:
+                    thumb_cache.store_bytes(self.url, data)
+                self.signals.loaded.emit(self.gen, self.url, img)
+                return
+            if from_disk:
+                thumb_cache.discard(self.url)
+        except Exception:
+            pass
+        self.signals.failed.emit(self.gen, self.url)
+
 
 class Step3QualityWidget(QWidget):
     qualityConfirmed = pyqtSignal(
@@ -41,6 +93,26 @@ class Step3QualityWidget(QWidget):
         self.items: List[Dict] = []
         self._meta_fetchers: List[InfoFetcher] = []  # running re-fetchers
         self._url_index: Dict[str, int] = {}  # map url->index for quick updates
+        # Quality choices found in self.items, computed once per set_items
+        self._abrs: List[int] = []
+        self._heights: List[int] = []
+        self._quality_kind = None  # kind the quality combo was last filled for
+        # Preview thumbnails download on the Qt event loop and decode on a small
+        # pool; rows are found by thumb url
+        self._nam = QNetworkAccessManager(self)
+        self._thumb_replies: Dict[str, QNetworkReply] = {}
+        self._thumb_pool = QThreadPool(self)
+        self._thumb_pool.setMaxThreadCount(6)
+        self._thumb_gen = 0
+        self._thumb_rows: Dict[str, List[int]] = {}  # not yet requested
+        self._thumb_waiting: Dict[str, List[int]] = {}  # requested, not loaded
+        self._thumb_failed: Dict[str, float] = {}  # url -> monotonic time of failure
+        # One QIcon per thumbnail URL shown, shared by rows and kept across revisits
+        self._icons: Dict[str, QIcon] = {}
+        self._preview_sig: tuple = ()  # rows the preview was last built from
+        self._placeholder_icon = QIcon(
+            thumb_cache.placeholder_pixmap(96, 54, self.settings.ui.accent_color_hex)
+        )
 
         root = QVBoxLayout(self)
         root.setContentsMargins(8, 8, 8, 8)
@@ -65,10 +137,17 @@ class Step3QualityWidget(QWidget):
         # Left: preview
         self.preview = QListWidget()
         self.preview.setIconSize(QSize(96, 54))
-        self.preview.setAlternatingRowColors(False)
         self.preview.setFrameShape(QFrame.Shape.NoFrame)
         self.preview.setSpacing(4)  # CHANGED: tighter spacing
         self.preview.setVerticalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
+        # One text line + a 96x54 icon per row: measure once, lay out in batches
+        self.preview.setUniformItemSizes(True)
+        self.preview.setLayoutMode(QListWidget.LayoutMode.Batched)
+        self.preview.setBatchSize(50)
+        # Thumbnails load only for rows on (or near) screen
+        self.preview.verticalScrollBar().valueChanged.connect(self._load_visible_thumbs)
+        self.preview.verticalScrollBar().rangeChanged.connect(self._load_visible_thumbs)
+        self.preview.viewport().installEventFilter(self)
         content.addWidget(self.preview, 2)
 
         # NEW: accent vertical separator between list and options
@@ -106,14 +185,18 @@ class Step3QualityWidget(QWidget):
         seg_row.addStretch(1)
         right.addLayout(seg_row)
 
-        # Format
+        # Format / Quality rows share one form layout
         self.cmb_format = QComboBox()
         self.cmb_format.setEditable(False)
-        right.addWidget(self._labeled("Format:", self.cmb_format))
-
-        # Quality
         self.cmb_quality = QComboBox()
-        right.addWidget(self._labeled("Quality:", self.cmb_quality))
+        form = QFormLayout()
+        form.setContentsMargins(0, 0, 0, 0)
+        form.setHorizontalSpacing(8)
+        form.setVerticalSpacing(8)
+        form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.AllNonFixedFieldsGrow)
+        form.addRow("Format:", self.cmb_format)
+        form.addRow("Quality:", self.cmb_quality)
+        right.addLayout(form)
 
         right.addStretch(1)
 
@@ -156,16 +239,6 @@ class Step3QualityWidget(QWidget):
         for w in (self.cmb_format, self.cmb_quality):
             w.installEventFilter(self._nowheel)
 
-    def _labeled(self, text: str, w: QWidget) -> QWidget:
-        row = QWidget()
-        lay = QHBoxLayout(row)
-        lay.setContentsMargins(0, 0, 0, 0)
-        lay.setSpacing(8)
-        lab = QLabel(text)
-        lay.addWidget(lab)
-        lay.addWidget(w, 1)
-        return row
-
     def _apply_kind_defaults(self):
         # Populate format choices based on kind
         if self.btn_audio.isChecked():
@@ -179,33 +252,29 @@ class Step3QualityWidget(QWidget):
 
     def set_items(self, items: List[Dict]):
         self.items = items
+        self._thumb_failed = {}
         self._url_index = {}
         for i, it in enumerate(items):
             u = it.get("webpage_url") or it.get("url")
             if u:
                 self._url_index[u] = i
+        self._index_formats()
 
         self.header.setText(
             f"Selected {len(items)} item(s). Choose output format and quality."
         )
-        self.preview.clear()
-        for it in items:
-            title = it.get("title") or "Untitled"
-            lw = QListWidgetItem(title)
-            pix = self._load_thumb(it)
-            if pix:
-                lw.setIcon(QIcon(pix))
-            self.preview.addItem(lw)
-
-        # Fade-in transition for a clean update
-        eff = QGraphicsOpacityEffect(self.preview)
-        self.preview.setGraphicsEffect(eff)
-        anim = QPropertyAnimation(eff, b"opacity", self)
-        anim.setDuration(200)
-        anim.setStartValue(0.0)
-        anim.setEndValue(1.0)
-        anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
-        anim.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
+        # Re-entering with the same selection keeps the built rows and icons
+        sig = tuple(
+            (
+                it.get("webpage_url") or it.get("url"),
+                it.get("title"),
+                self._thumb_url(it),
+            )
+            for it in items
+        )
+        if sig != self._preview_sig:
+            self._preview_sig = sig
+            self._rebuild_preview(items)
 
         # REMOVE height constraints so list fills and scrolls naturally
         # if len(items) <= 1:
@@ -219,22 +288,171 @@ class Step3QualityWidget(QWidget):
         if hasattr(self, "_refetch_timer"):
             self._refetch_timer.stop()
 
-    def _load_thumb(self, it: Dict):
-        url = it.get("thumbnail") or (it.get("thumbnails") or [{}])[-1].get("url")
-        if not url:
-            return None
+    def _rebuild_preview(self, items: List[Dict]):
+        self._cancel_thumbs()
+        # Keep only the icons the new rows use
+        old_icons, self._icons = self._icons, {}
+        # Suppress repaints while rows are re-added; one paint at the end
+        self.preview.setUpdatesEnabled(False)
         try:
-            import requests
-
-            r = requests.get(url, timeout=6)
-            if not r.ok:
-                return None
-            pix = QPixmap()
-            if pix.loadFromData(r.content):
-                return pix
-        except Exception:
-            return None
-        return None
+            self.preview.clear()
+            for row, it in enumerate(items):
+                title = it.get("title") or "Untitled"
+                lw = QListWidgetItem(title)
+                url = self._thumb_url(it)
+                if url:
+                    lw.setData(_THUMB_URL_ROLE, url)
+                    icon = self._icons.get(url) or old_icons.get(url)
+                    if icon is None:
+                        pix = QPixmapCache.find(url)
+                        icon = QIcon(pix) if pix is not None else None
+                    if icon is not None:
+                        self._icons[url] = icon
+                        lw.setIcon(icon)
+                    else:
+                        lw.setIcon(self._placeholder_icon)
+                        self._thumb_rows.setdefault(url, []).append(row)
+                else:
+                    lw.setIcon(self._placeholder_icon)
+                self.preview.addItem(lw)
+        finally:
+            self.preview.setUpdatesEnabled(True)
+        # Batched layout finishes on the event loop; measure visible rows after it
+        QTimer.singleShot(0, self._load_visible_thumbs)
+
+        # Fade-in transition for a clean update
+        if len(items) <= FADE_MAX_ITEMS:
+            eff = QGraphicsOpacityEffect(self.preview)
+            self.preview.setGraphicsEffect(eff)
+            anim = QPropertyAnimation(eff, b"opacity", self)
+            anim.setDuration(200)
+            anim.setStartValue(0.0)
+            anim.setEndValue(1.0)
+            anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
+            anim.finished.connect(lambda e=eff: self._drop_fade(e))
+            anim.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
+        else:
+            self.preview.setGraphicsEffect(None)
+
+    def _drop_fade(self, eff: QGraphicsOpacityEffect):
+        # An effect left at opacity 1.0 still renders the list offscreen
+        if self.preview.graphicsEffect() is eff:
+            self.preview.setGraphicsEffect(None)
+
+    def _thumb_url(self, it: Dict) -> Optional[str]:
+        return thumb_cache.thumb_url(it)
+
+    def _cancel_thumbs(self):
+        # Abort downloads of the previous selection; late decodes fail the gen check
+        self._thumb_gen += 1
+        replies = list(self._thumb_replies.values())
+        self._thumb_replies.clear()
+        for reply in replies:
+            reply.abort()
+        self._thumb_rows = {}
+        self._thumb_waiting = {}
+        self._thumb_failed = {}
+
+    def eventFilter(self, obj, event):
+        if obj is self.preview.viewport() and event.type() in (
+            QEvent.Type.Resize,
+            QEvent.Type.Show,
+        ):
+            self._load_visible_thumbs()
+        return super().eventFilter(obj, event)
+
+    def _row_near(self, y: int, step: int) -> int:
+        # indexAt can land in the spacing between rows; nudge a few pixels
+        for dy in range(0, 4 * step, step):
+            row = self.preview.indexAt(QPoint(8, y + dy)).row()
+            if row >= 0:
+                return row
+        return -1
+
+    def _load_visible_thumbs(self, *_):
+        if not self._thumb_rows or not self.preview.isVisible():
+            return
+        vp = self.preview.viewport().rect()
+        first = self._row_near(vp.top(), 4)
+        last = self._row_near(vp.bottom(), -4)
+        if last < 0:
+            # Either the rows end above the viewport bottom, or layout is pending
+            end = self.preview.visualItemRect(
+                self.preview.item(self.preview.count() - 1)
+            )
+            if not end.isValid():
+                return  # rangeChanged fires once the batched layout lands
+            last = self.preview.count() - 1
+        if first < 0:
+            first = 0
+        first = max(0, first - THUMB_PREFETCH_ROWS)
+        last = min(self.preview.count() - 1, last + THUMB_PREFETCH_ROWS)
+        urls: List[str] = []
+        now = time.monotonic()
+        for row in range(first, last + 1):
+            it = self.preview.item(row)
+            url = it.data(_THUMB_URL_ROLE) if it is not None else None
+            failed_at = self._thumb_failed.get(url)
+            if failed_at is not None and now - failed_at < THUMB_RETRY_S:
+                continue  # stays in _thumb_rows until the backoff has passed
+            rows = self._thumb_rows.pop(url, None) if url else None
+            if rows is not None:
+                self._thumb_waiting[url] = rows
+                urls.append(url)
+        self._start_thumbs(urls)
+
+    def _start_thumbs(self, urls: List[str]):
+        for url in urls:
+            # Fetched in an earlier run: decode straight from the disk cache
+            if thumb_cache.has(url):
+                self._decode_thumb(url, None)
+                continue
+            req = QNetworkRequest(QUrl(url))
+            req.setAttribute(QNetworkRequest.Attribute.Http2AllowedAttribute, True)
+            req.setTransferTimeout(5000)
+            reply = self._nam.get(req)
+            thumb_cache.cap_reply(reply)
+            self._thumb_replies[url] = reply
+            reply.finished.connect(lambda r=reply, u=url: self._on_thumb_reply(r, u))
+
+    def _on_thumb_reply(self, reply: QNetworkReply, url: str):
+        reply.deleteLater()
+        if self._thumb_replies.get(url) is not reply:
+            return  # aborted by _cancel_thumbs
+        del self._thumb_replies[url]
+        data = thumb_cache.reply_bytes(reply)
+        if data is not None:
+            self._decode_thumb(url, data)
+        else:
+            self._on_thumb_failed(self._thumb_gen, url)
+
+    def _decode_thumb(self, url: str, data: Optional[bytes]):
+        task = _PreviewThumbTask(self._thumb_gen, url, data, self.devicePixelRatioF())
+        task.signals.loaded.connect(self._on_thumb_loaded)
+        task.signals.failed.connect(self._on_thumb_failed)
+        self._thumb_pool.start(task)
+
+    def _on_thumb_failed(self, gen: int, url: str):
+        if gen != self._thumb_gen:
+            return
+        # Back to not-requested; the lazy loader retries once it's in view
+        # and THUMB_RETRY_S has passed, or after the next set_items
+        self._thumb_failed[url] = time.monotonic()
+        rows = self._thumb_waiting.pop(url, None)
+        if rows:
+            self._thumb_rows.setdefault(url, []).extend(rows)
+
+    def _on_thumb_loaded(self, gen: int, url: str, img: QImage):
+        if gen != self._thumb_gen:
+            return
+        pix = QPixmap.fromImage(img)
+        QPixmapCache.insert(url, pix)
+        icon = self._icons[url] = QIcon(pix)
+        for row in self._thumb_waiting.pop(url, []):
+            it = self.preview.item(row)
+            # Same defensive check as step 1: row must still show this thumb
+            if it is not None and it.data(_THUMB_URL_ROLE) == url:
+                it.setIcon(icon)
 
     def _kind_toggled(self, audio_checked: bool):
         self._apply_kind_defaults()
@@ -243,7 +461,26 @@ class Step3QualityWidget(QWidget):
         fmts = it.get("formats")
         return bool(fmts and isinstance(fmts, list) and len(fmts) > 0)
 
+    def _index_formats(self):
+        # One pass over every item's formats; kind toggles just reuse the result
+        abrs, heights = set(), set()
+        for it in self.items:
+            if not self._has_formats(it):
+                continue
+            for f in it["formats"]:
+                if f.get("abr") and f.get("acodec") != "none":
+                    abrs.add(int(f["abr"]))
+                if f.get("height") and f.get("vcodec") != "none":
+                    heights.add(int(f["height"]))
+        self._abrs = sorted(abrs, reverse=True)
+        self._heights = sorted(heights, reverse=True)
+        self._quality_kind = None
+
     def _populate_quality_options(self):
+        kind = "audio" if self.btn_audio.isChecked() else "video"
+        if kind == self._quality_kind and self.cmb_quality.count() > 0:
+            return  # same items, same kind: options would be identical
+        self._quality_kind = kind
         self.cmb_quality.clear()
         default_v = ["best", "2160p", "1440p", "1080p", "720p", "480p", "360p"]
         default_a = ["best", "320k", "256k", "192k", "160k", "128k"]
@@ -259,31 +496,12 @@ class Step3QualityWidget(QWidget):
             self.cmb_quality.addItems(["best", "worse"])
             return
 
-        fmts_lists = [
-            it.get("formats") or [] for it in self.items if self._has_formats(it)
-        ]
-        if self.btn_audio.isChecked():
-            abrs = sorted(
-                {
-                    int(f.get("abr"))
-                    for fmts in fmts_lists
-                    for f in fmts
-                    if f.get("abr") and f.get("acodec") != "none"
-                },
-                reverse=True,
-            )
+        if kind == "audio":
+            abrs = self._abrs
             opts = ["best"] + [f"{a}k" for a in abrs] if abrs else default_a
             self.cmb_quality.addItems(opts)
         else:
-            heights = sorted(
-                {
-                    int(f.get("height"))
-                    for fmts in fmts_lists
-                    for f in fmts
-                    if f.get("height") and f.get("vcodec") != "none"
-                },
-                reverse=True,
-            )
+            heights = self._heights
             opts = ["best"] + [f"{h}p" for h in heights] if heights else default_v
             self.cmb_quality.addItems(opts)
 
@@ -293,15 +511,8 @@ class Step3QualityWidget(QWidget):
         return
 
     def _cleanup_fetchers(self):
-        for f in self._meta_fetchers:
-            try:
-                f.finished_ok.disconnect()
-            except Exception:
-                pass
-            try:
-                f.finished_fail.disconnect()
-            except Exception:
-                pass
+        # Refetching is disabled, so nothing is ever connected here; if it comes
+        # back, parent fetchers to self and let Qt drop their connections
         self._meta_fetchers.clear()
 
     def _confirm(self):
@@ -313,7 +524,7 @@ class Step3QualityWidget(QWidget):
         quality = self.cmb_quality.currentText().strip() or "best"
         self.settings.defaults.kind = kind
         self.settings.defaults.format = fmt
-        SettingsManager().save(self.settings)
+        SettingsManager().save_async(self.settings)
         self.qualityConfirmed.emit(
             {"items": self.items, "kind": kind, "format": fmt, "quality": quality}
         )
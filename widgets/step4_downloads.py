@@ -1,8 +1,20 @@
 import os
 from typing import Dict, List, Optional
 
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
-from PyQt6.QtGui import QPixmap
+
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QObject,
+    QPoint,
+    QRect,
+    QRectF,
+    QRunnable,
+    QSize,
+    QThreadPool,
+    QTimer,
+)
+from PyQt6.QtGui import QColor, QImage, QPainter, QPalette, QPixmap, QPixmapCache
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -14,81 +26,175 @@ from PyQt6.QtWidgets import (
     QListWidgetItem,
     QProgressBar,
     QFrame,  # NEW
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionProgressBar,
+    QStyleOptionViewItem,
 )
 
+from core import thumb_cache
 from core.settings import AppSettings, SettingsManager
 from core.ffmpeg_manager import FF_EXE, FF_DIR
 from core.yt_manager import Downloader, InfoFetcher  # add InfoFetcher
 
-
-class DownloadItemWidget(QWidget):
-    def __init__(self, title: str):
-        super().__init__()
-        lay = QHBoxLayout(self)
-        lay.setContentsMargins(4, 4, 4, 4)  # keep in sync with Step 1 spacing feel
-        lay.setSpacing(6)  # CHANGED: tighter spacing
-
-        self.thumb = QLabel()
-        self.thumb.setFixedSize(96, 54)
-        self.thumb.setStyleSheet(
-            "background:#111;border:1px solid #333;border-radius:6px;"
+# Per-row state lives on the QListWidgetItem; the delegate paints it directly
+THUMB_ROLE = Qt.ItemDataRole.UserRole  # QPixmap, pre-scaled to the thumb box
+STATUS_ROLE = int(Qt.ItemDataRole.UserRole) + 1  # str, or None before start
+PROGRESS_ROLE = int(Qt.ItemDataRole.UserRole) + 2  # int 0..100
+BUSY_ROLE = int(Qt.ItemDataRole.UserRole) + 3  # bool, indeterminate bar
+
+BUSY_PULSE_MS = 250  # one shared tick for every "Processing" bar
+BUSY_STEPS = 8  # positions of the sliding busy segment
+PROGRESS_INTERVAL_MS = 100  # yt-dlp reports many times a second; repaint <=10 Hz
+_PROGRESS_FMT = "%.1f%% | %.2f MB/s | ETA %ds"
+_MB = 1.0 / (1024 * 1024)
+# Leading word of a Downloader status -> busy bar on/off (others leave it alone)
+_BUSY_BY_STATUS = {"Processing": True, "Error": False, "Done": False, "Stopped": False}
+
+THUMB_W = thumb_cache.ICON_SIZE.width()
+THUMB_H = thumb_cache.ICON_SIZE.height()
+
+
+# Paints thumb/title/status/progress per row instead of a widget tree per row
+class DownloadItemDelegate(QStyledItemDelegate):
+    PAD = 8
+    SPACING = 6
+    BAR_H = 16
+
+    def __init__(self, view: QListWidget):
+        super().__init__(view)
+        # Hidden template bar so painted bars pick up the #DlProgress stylesheet
+        self._bar = QProgressBar(view)
+        self._bar.setObjectName("DlProgress")
+        self._bar.hide()
+        self.busy_phase = 0  # advanced by Step4DownloadsWidget's pulse timer
+
+    def sizeHint(self, option, index) -> QSize:
+        # Reserve the started layout up front so rows don't jump on Start
+        lh = option.fontMetrics.height()
+        inner = max(THUMB_H, 2 * lh + self.BAR_H + 2 * self.SPACING)
+        return QSize(THUMB_W + 2 * self.PAD, inner + 2 * self.PAD)
+
+    def paint(self, painter: QPainter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        widget = opt.widget
+        title = opt.text or "Untitled"
+        # Row background/hover from the stylesheet, without the default text
+        opt.text = ""
+        widget.style().drawControl(
+            QStyle.ControlElement.CE_ItemViewItem, opt, painter, widget
         )
-        self.thumb.setAlignment(
-            Qt.AlignmentFlag.AlignCenter
-        )  # NEW: center with letterbox
-        self.thumb.setScaledContents(False)  # NEW: prevent stretch
 
-        self.title = QLabel(title)
-        self.title.setWordWrap(True)
+        r = opt.rect.adjusted(self.PAD, self.PAD, -self.PAD, -self.PAD)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Thumbnail box, letterboxed
+        thumb = QRect(r.left(), r.top() + (r.height() - THUMB_H) // 2, THUMB_W, THUMB_H)
+        painter.setPen(QColor("#333"))
+        painter.setBrush(QColor("#111"))
+        painter.drawRoundedRect(QRectF(thumb).adjusted(0.5, 0.5, -0.5, -0.5), 6, 6)
+        pix = index.data(THUMB_ROLE)
+        if isinstance(pix, QPixmap) and not pix.isNull():
+            size = pix.deviceIndependentSize().toSize()
+            pos = QPoint(
+                thumb.left() + (THUMB_W - size.width()) // 2,
+                thumb.top() + (THUMB_H - size.height()) // 2,
+            )
+            painter.drawPixmap(QRect(pos, size), pix)
+
+        # Text column
+        left = thumb.right() + 1 + self.SPACING
+        col = QRect(left, r.top(), r.right() - left + 1, r.height())
+        fm = opt.fontMetrics
+        lh = fm.height()
+        painter.setPen(opt.palette.color(QPalette.ColorRole.Text))
+        elide = Qt.TextElideMode.ElideRight
+        align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        status = index.data(STATUS_ROLE)
+        if status is None:
+            # Not started yet: title only
+            painter.drawText(col, align, fm.elidedText(title, elide, col.width()))
+            painter.restore()
+            return
 
-        self.status = QLabel("Waiting...")
-        self.progress = QProgressBar()
-        self.progress.setObjectName("DlProgress")
-        self.progress.setValue(0)
+        top = col.top() + (col.height() - (2 * lh + self.BAR_H + 2 * self.SPACING)) // 2
+        line = QRect(col.left(), top, col.width(), lh)
+        painter.drawText(line, align, fm.elidedText(title, elide, col.width()))
+        line.translate(0, lh + self.SPACING)
+        painter.drawText(line, align, fm.elidedText(status, elide, col.width()))
+
+        busy = bool(index.data(BUSY_ROLE))
+        value = index.data(PROGRESS_ROLE) or 0
+        bar = QStyleOptionProgressBar()
+        bar.initFrom(self._bar)
+        bar.rect = QRect(
+            col.left(), line.bottom() + 1 + self.SPACING, col.width(), self.BAR_H
+        )
+        bar.state |= QStyle.StateFlag.State_Horizontal
+        bar.minimum = 0
+        bar.maximum = 100
+        style = self._bar.style()
+        if busy:
+            # Static groove plus a segment that steps along it on each pulse; a
+            # real indeterminate bar would need its own 60 Hz animation per row
+            style.drawControl(
+                QStyle.ControlElement.CE_ProgressBarGroove, bar, painter, self._bar
+            )
+            seg = bar.rect.width() // 4
+            step = self.busy_phase % (2 * BUSY_STEPS - 2)
+            if step >= BUSY_STEPS:
+                step = 2 * BUSY_STEPS - 2 - step  # bounce back
+            x = (bar.rect.width() - seg) * step // (BUSY_STEPS - 1)
+            bar.rect = QRect(bar.rect.left() + x, bar.rect.top(), seg, self.BAR_H)
+            bar.progress = 100
+            style.drawControl(
+                QStyle.ControlElement.CE_ProgressBarContents, bar, painter, self._bar
+            )
+        else:
+            bar.progress = value
+            bar.textVisible = True
+            bar.text = f"{value}%"
+            bar.textAlignment = Qt.AlignmentFlag.AlignCenter
+            style.drawControl(
+                QStyle.ControlElement.CE_ProgressBar, bar, painter, self._bar
+            )
+        painter.restore()
 
-        col = QVBoxLayout()
-        col.addWidget(self.title)
-        col.addWidget(self.status)
-        col.addWidget(self.progress)
 
-        lay.addWidget(self.thumb)
-        lay.addLayout(col, 1)
+class _ThumbSignals(QObject):
+    done = pyqtSignal(str, QImage)  # thumb_url, thumb-box image
+    failed = pyqtSignal(str)  # thumb_url
 
-        # Reserve full height before hiding status/progress so the list doesn't jump
-        self._full_size_hint = self.sizeHint()  # CHANGED: compute while visible
-        self.status.hide()
-        self.progress.hide()
 
-    def full_size_hint(self):
-        return self._full_size_hint
+# Fetch + decode one thumbnail URL on the shared pool
+class _ThumbJob(QRunnable):
+    def __init__(self, thumb_url: str, dpr: float = 1.0):
+        super().__init__()
+        self.turl = thumb_url
+        self.dpr = dpr
+        self.signals = _ThumbSignals()
+
+    def run(self):
+        try:
+            data = thumb_cache.fetch_bytes(self.turl, timeout=8)
+            if data:
+                img = thumb_cache.decode_icon(data, self.dpr)
+                if not img.isNull():
+                    # QImage crosses threads safely; the pixmap is made in the UI
+                    self.signals.done.emit(self.turl, img)
+                    return
+                thumb_cache.discard(self.turl)
+        except Exception:
+            pass
+        self.signals.failed.emit(self.turl)
 
 
 class Step4DownloadsWidget(QWidget):
     allFinished = pyqtSignal()
     backRequested = pyqtSignal()
 
-    class _ThumbWorker(QThread):
-        done = pyqtSignal(str, QPixmap)  # video_url, pixmap
-
-        def __init__(self, video_url: str, thumb_url: str, parent=None):
-            super().__init__(parent)
-            self.vurl = video_url
-            self.turl = thumb_url
-
-        def run(self):
-            try:
-                import requests
-
-                r = requests.get(self.turl, timeout=8)
-                if not r.ok:
-                    return
-                px = QPixmap()
-                if px.loadFromData(r.content):
-                    # ensure we emit original pixmap; scaling is done in UI thread
-                    self.done.emit(self.vurl, px)
-            except Exception:
-                pass
-
     def __init__(self, settings: AppSettings):
         super().__init__()
         self.settings = settings
@@ -99,7 +205,23 @@ class Step4DownloadsWidget(QWidget):
         self.quality = "best"
         self.downloader: Optional[Downloader] = None
         self._meta_fetchers: dict[int, InfoFetcher] = {}
-        self._thumb_threads: List[Step4DownloadsWidget._ThumbWorker] = []  # NEW
+        # Thumbnails load on a bounded pool instead of a QThread per row
+        self._thumb_pool = QThreadPool(self)
+        self._thumb_pool.setMaxThreadCount(8)
+        self._row_keys: List[tuple] = []  # (video URL, thumb URL) per current row
+        # Thumb URL -> rows waiting on the one job fetching it (a video queued
+        # twice, or videos sharing a still, all get painted)
+        self._thumb_waiters: Dict[str, List[int]] = {}
+        # Latest progress per row, applied in one batch per timer tick
+        self._pending_progress: Dict[int, tuple] = {}
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(PROGRESS_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        # Rows showing the busy bar; one timer repaints just those
+        self._busy_rows: set = set()
+        self._busy_timer = QTimer(self)
+        self._busy_timer.setInterval(BUSY_PULSE_MS)
+        self._busy_timer.timeout.connect(self._pulse_busy)
 
         lay = QVBoxLayout(self)
         lay.setContentsMargins(8, 8, 8, 8)
@@ -128,6 +250,12 @@ class Step4DownloadsWidget(QWidget):
         self.list.setSpacing(4)
         self.list.setVerticalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
         self.list.setSelectionMode(QListWidget.SelectionMode.NoSelection)
+        # Every row has the same fixed height: measure once, lay out in batches
+        self.list.setUniformItemSizes(True)
+        self.list.setLayoutMode(QListWidget.LayoutMode.Batched)
+        self.list.setBatchSize(50)
+        self._delegate = DownloadItemDelegate(self.list)
+        self.list.setItemDelegate(self._delegate)
         lay.addWidget(self.list, 1)
 
         # Footer with separator and controls (Back on left, folder + actions on right)
@@ -173,31 +301,12 @@ class Step4DownloadsWidget(QWidget):
         self._populate()
 
     def _populate(self):
-        self.list.clear()
-        for idx, it in enumerate(self.items):
-            title = it.get("title") or "Untitled"
-            w = DownloadItemWidget(title)
-            # Async thumb fetch
-            vurl = (it.get("webpage_url") or it.get("url")) or ""
-            thumb_url = it.get("thumbnail") or (it.get("thumbnails") or [{}])[-1].get(
-                "url"
-            )
-            if thumb_url and vurl:
-                worker = Step4DownloadsWidget._ThumbWorker(vurl, thumb_url, self)
-                worker.done.connect(self._set_dl_thumb_if_match)
-                worker.finished.connect(
-                    lambda w=worker: (
-                        self._thumb_threads.remove(w)
-                        if w in self._thumb_threads
-                        else None
-                    )
-                )
-                self._thumb_threads.append(worker)
-                worker.start()
-            item = QListWidgetItem()
-            item.setSizeHint(w.full_size_hint())  # CHANGED: keep height stable
-            self.list.addItem(item)
-            self.list.setItemWidget(item, w)
+        # Suppress repaints while rows/widgets are added; one paint at the end
+        self.list.setUpdatesEnabled(False)
+        try:
+            self._populate_rows()
+        finally:
+            self.list.setUpdatesEnabled(True)
         self.btn_start.setEnabled(True)
         self.btn_start.setText("Start")
         self.btn_done.setVisible(False)
@@ -208,6 +317,46 @@ class Step4DownloadsWidget(QWidget):
         # if getattr(self.settings.ui, "background_metadata_enabled", True):
         #     self._start_bg_metadata()
 
+    def _populate_rows(self):
+        self._drop_pending_progress()
+        self._stop_busy_pulse()
+        keys = [
+            ((it.get("webpage_url") or it.get("url")) or "", thumb_cache.thumb_url(it))
+            for it in self.items
+        ]
+        if keys == self._row_keys and self.list.count() == len(keys):
+            self._reuse_rows()
+            return
+        self._row_keys = keys
+        self._thumb_pool.clear()  # queued thumbs of the previous list
+        self._thumb_waiters.clear()
+        self.list.clear()
+        for idx, (vurl, thumb_url) in enumerate(keys):
+            # Async thumb fetch
+            lw = QListWidgetItem(self.items[idx].get("title") or "Untitled")
+            if thumb_url and vurl:
+                self._load_thumb(lw, idx, thumb_url)
+            self.list.addItem(lw)
+
+    # Same videos as the current rows (Back -> Next): keep rows and thumbnails,
+    # just return them to the not-started state
+    def _reuse_rows(self):
+        for idx, it in enumerate(self.items):
+            row = self.list.item(idx)
+            row.setText(it.get("title") or "Untitled")
+            row.setData(STATUS_ROLE, None)
+            row.setData(PROGRESS_ROLE, 0)
+            row.setData(BUSY_ROLE, False)
+            vurl, turl = self._row_keys[idx]
+            # Retry thumbs that failed last time; ones still loading keep waiting
+            if (
+                turl
+                and vurl
+                and row.data(THUMB_ROLE) is None
+                and turl not in self._thumb_waiters
+            ):
+                self._load_thumb(row, idx, turl)
+
     def _start_bg_metadata(self):
         for idx, it in enumerate(self.items):
             if not self._needs_metadata(it) or idx in self._meta_fetchers:
@@ -216,31 +365,13 @@ class Step4DownloadsWidget(QWidget):
             if not url:
                 continue
             f = InfoFetcher(url)
+            # Parent owns the thread until it has really finished
+            f.setParent(self)
+            f.finished.connect(f.deleteLater)
 
             def _ok(meta: dict, i=idx):
                 try:
-                    self.items[i] = {**self.items[i], **(meta or {})}
-                    w = self._get_widget(i)
-                    if w:
-                        title = self.items[i].get("title") or "Untitled"
-                        w.title.setText(title)
-                        turl = self.items[i].get("thumbnail") or (
-                            self.items[i].get("thumbnails") or [{}]
-                        )[-1].get("url")
-                        if turl:
-                            try:
-                                import requests
-
-                                r = requests.get(turl, timeout=6)
-                                if r.ok:
-                                    px = QPixmap()
-                                    if px.loadFromData(r.content):
-                                        w.thumb.setPixmap(px)
-                            except Exception:
-                                pass
-                        w.status.setText("Waiting...")
-                        w.progress.setRange(0, 100)
-                        w.progress.setValue(0)
+                    self._apply_bg_metadata(i, meta)
                 finally:
                     self._meta_fetchers.pop(i, None)
 
@@ -252,6 +383,41 @@ class Step4DownloadsWidget(QWidget):
             self._meta_fetchers[idx] = f
             f.start()
 
+    def _apply_bg_metadata(self, i: int, meta: dict):
+        try:
+            self.items[i] = {**self.items[i], **(meta or {})}
+            row = self.list.item(i)
+            if row:
+                it = self.items[i]
+                row.setText(it.get("title") or "Untitled")
+                turl = thumb_cache.thumb_url(it)
+                vurl = it.get("webpage_url") or it.get("url")
+                if turl and vurl:
+                    self._load_thumb(row, i, turl)
+                if row.data(STATUS_ROLE) is not None:
+                    row.setData(STATUS_ROLE, "Waiting...")
+                    row.setData(PROGRESS_ROLE, 0)
+                    row.setData(BUSY_ROLE, False)
+        except Exception:
+            pass
+
+    def _load_thumb(self, row: QListWidgetItem, idx: int, thumb_url: str):
+        # Steps 1/3 decode the same resolved URL; reuse their pixmap without a job
+        pix = QPixmapCache.find(thumb_url)
+        if pix is not None:
+            row.setData(THUMB_ROLE, self._fit_thumb(pix))
+            return
+        # Rows sharing a thumbnail wait on the job already fetching it
+        waiters = self._thumb_waiters.get(thumb_url)
+        if waiters is not None:
+            waiters.append(idx)
+            return
+        self._thumb_waiters[thumb_url] = [idx]
+        job = _ThumbJob(thumb_url, self.devicePixelRatioF())
+        job.signals.done.connect(self._on_thumb_done)
+        job.signals.failed.connect(self._on_thumb_failed)
+        self._thumb_pool.start(job)
+
     def _cleanup_bg_metadata(self):  # NEW
         # Disconnect finished signals to avoid updating stale widgets on later runs
         for i, f in list(self._meta_fetchers.items()):
@@ -263,6 +429,7 @@ class Step4DownloadsWidget(QWidget):
                 f.finished_fail.disconnect()
             except Exception:
                 pass
+            f.cancel()  # result no longer wanted; kills its yt-dlp process
         self._meta_fetchers.clear()
 
     # NEW: small helper to mirror Downloader heuristic
@@ -315,17 +482,14 @@ class Step4DownloadsWidget(QWidget):
         os.makedirs(base, exist_ok=True)
         # Save last dir
         self.settings.last_download_dir = base
-        self.settings_mgr.save(self.settings)
+        self.settings_mgr.save_async(self.settings)
 
-        # Ensure all items show their UI only now
+        # Ensure all items show their status/progress only now
         for i in range(self.list.count()):
-            w = self._get_widget(i)
-            if w:
-                w.status.setText("Queued")
-                w.status.show()
-                w.progress.setRange(0, 100)
-                w.progress.setValue(0)
-                w.progress.show()
+            row = self.list.item(i)
+            row.setData(STATUS_ROLE, "Queued")
+            row.setData(PROGRESS_ROLE, 0)
+            row.setData(BUSY_ROLE, False)
 
         ff_path = FF_DIR if os.path.exists(FF_EXE) else None
         self.downloader = Downloader(
@@ -363,55 +527,89 @@ class Step4DownloadsWidget(QWidget):
             self.lbl_dir.setText(d)
 
     def _on_item_status(self, idx: int, text: str):
-        w = self._get_widget(idx)
-        if w:
-            if not w.status.isVisible():
-                w.status.show()  # ensure visible after start
-            if not w.progress.isVisible():
-                w.progress.show()
-            w.status.setText(text)
+        # Land any queued progress first so it can't overwrite this status later
+        pending = self._pending_progress.pop(idx, None)
+        if pending:
+            self._apply_progress(idx, *pending)
+        row = self.list.item(idx)
+        if row:
+            row.setData(STATUS_ROLE, text)
             # Busy indicator for processing phase
-            if text.startswith("Processing"):
-                w.progress.setRange(0, 0)  # indeterminate
-            elif (
-                text.startswith("Error")
-                or text.startswith("Done")
-                or text.startswith("Stopped")
-            ):
-                w.progress.setRange(0, 100)
+            busy = _BUSY_BY_STATUS.get(text.partition(" ")[0].rstrip(".:"))
+            if busy:
+                row.setData(BUSY_ROLE, True)  # indeterminate
+                self._busy_rows.add(idx)
+                if not self._busy_timer.isActive():
+                    self._busy_timer.start()
+            elif busy is not None:
+                row.setData(BUSY_ROLE, False)
 
     def _on_item_progress(
         self, idx: int, percent: float, speed: float, eta: Optional[int]
     ):
-        w = self._get_widget(idx)
-        if w:
+        if percent >= 99.9:
+            # Completion is never held back
+            self._pending_progress.pop(idx, None)
+            self._apply_progress(idx, percent, speed, eta)
+            return
+        self._pending_progress[idx] = (percent, speed, eta)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        pending, self._pending_progress = self._pending_progress, {}
+        for idx, args in pending.items():
+            self._apply_progress(idx, *args)
+        self._progress_timer.stop()  # restarted by the next report
+
+    def _drop_pending_progress(self):
+        self._pending_progress.clear()
+        self._progress_timer.stop()
+
+    def _stop_busy_pulse(self):
+        self._busy_rows.clear()
+        self._busy_timer.stop()
+
+    def _pulse_busy(self):
+        self._delegate.busy_phase += 1
+        for idx in list(self._busy_rows):
+            row = self.list.item(idx)
+            if row is None or not row.data(BUSY_ROLE):
+                self._busy_rows.discard(idx)
+            else:
+                self.list.update(self.list.indexFromItem(row))
+        if not self._busy_rows:
+            self._busy_timer.stop()
+
+    def _apply_progress(
+        self, idx: int, percent: float, speed: float, eta: Optional[int]
+    ):
+        row = self.list.item(idx)
+        if row:
             # Ensure determinate during downloading
-            if w.progress.minimum() == 0 and w.progress.maximum() == 0:
-                w.progress.setRange(0, 100)
-            w.progress.setValue(int(percent))
+            row.setData(BUSY_ROLE, False)
+            row.setData(PROGRESS_ROLE, int(percent))
             if eta is not None:
-                w.status.setText(
-                    f"{percent:.1f}% | {speed/1024/1024:.2f} MB/s | ETA {eta}s"
-                )
+                row.setData(STATUS_ROLE, _PROGRESS_FMT % (percent, speed * _MB, eta))
 
     def _on_item_thumb(self, idx: int, data: bytes):
-        w = self._get_widget(idx)
-        if w:
-            px = QPixmap()
-            if px.loadFromData(data):
-                w.thumb.setPixmap(
-                    px.scaled(
-                        w.thumb.size(),
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation,
-                    )
-                )  # CHANGED
-
-    def _get_widget(self, idx: int) -> Optional[DownloadItemWidget]:
-        it = self.list.item(idx)
-        if not it:
-            return None
-        return self.list.itemWidget(it)
+        row = self.list.item(idx)
+        # The row usually already shows this thumb from _load_thumb; skip the decode
+        if row and row.data(THUMB_ROLE) is None:
+            img = thumb_cache.decode_icon(data, self.devicePixelRatioF())
+            if not img.isNull():
+                row.setData(THUMB_ROLE, self._fit_thumb(QPixmap.fromImage(img)))
+
+    # Scale once to the thumb box (device pixels) so paints never resample
+    def _fit_thumb(self, pix: QPixmap) -> QPixmap:
+        dpr = max(1.0, self.devicePixelRatioF())
+        px = pix.scaled(
+            thumb_cache.ICON_SIZE * dpr,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        px.setDevicePixelRatio(dpr)
+        return px
 
     def _on_all_finished(self):
         self.btn_done.setVisible(True)
@@ -432,7 +630,12 @@ class Step4DownloadsWidget(QWidget):
 
     def reset(self):
         self._cleanup_bg_metadata()
+        self._drop_pending_progress()
+        self._stop_busy_pulse()
+        self._thumb_pool.clear()
+        self._thumb_waiters.clear()
         self.list.clear()
+        self._row_keys = []
         self.items = []
         self.downloader = None
         self.btn_start.setText("Start")
@@ -443,21 +646,16 @@ class Step4DownloadsWidget(QWidget):
         self.btn_start.setEnabled(False)
         self.btn_done.setVisible(False)
 
-    # NEW: apply a thumbnail to the matching list widget by video URL
-    def _set_dl_thumb_if_match(self, video_url: str, pix: QPixmap):
-        try:
-            for i, it in enumerate(self.items):
-                u = (it.get("webpage_url") or it.get("url")) or ""
-                if u == video_url:
-                    w = self._get_widget(i)
-                    if w:
-                        w.thumb.setPixmap(
-                            pix.scaled(
-                                w.thumb.size(),
-                                Qt.AspectRatioMode.KeepAspectRatio,
-                                Qt.TransformationMode.SmoothTransformation,
-                            )
-                        )
-                    break
-        except Exception:
-            pass
+    # NEW: apply a thumbnail to every row waiting on it
+    def _on_thumb_done(self, thumb_url: str, img: QImage):
+        pix = QPixmap.fromImage(img)
+        QPixmapCache.insert(thumb_url, pix)
+        fitted = self._fit_thumb(pix)
+        for idx in self._thumb_waiters.pop(thumb_url, []):
+            row = self.list.item(idx)
+            if row:
+                row.setData(THUMB_ROLE, fitted)
+
+    def _on_thumb_failed(self, thumb_url: str):
+        # Let a later request retry instead of queueing behind a dead fetch
+        self._thumb_waiters.pop(thumb_url, None)